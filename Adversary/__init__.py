@@ -1,2 +1,9 @@
 from Adversary.adversary import Adversary
 from Adversary.attacks import *
+from Adversary.constants import lazy_constant
+from Adversary.taggers import LexiconTagger, Tagger, TextBlobTagger, tokenize
+
+
+def __getattr__(name):
+    # SYNONYMS and NEUTRAL_WORDS are loaded on first access, as they were reachable here through star imports
+    return lazy_constant(__name__, name)
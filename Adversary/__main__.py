@@ -0,0 +1,5 @@
+import sys
+
+from Adversary.cli import main
+
+sys.exit(main())
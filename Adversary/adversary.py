@@ -1,28 +1,74 @@
-from copy import copy
+import os
+import time
+from collections import OrderedDict, namedtuple
 from functools import partial
-from random import random, seed
-
-import pandas as pd
-from textblob import TextBlob
+from itertools import chain, islice
+from random import Random
 
 from Adversary.attacks import *
+from Adversary.output import OUTPUT_FORMATS, GeneratedTextWriter, write_dataframe
+from Adversary.prediction import predict_distinct, predict_texts
+from Adversary.profiling import Profiler, profile_stage
+from Adversary.progress import ProgressReporter, print_sink
+from Adversary.sampling import SAMPLERS
+from Adversary.taggers import TextBlobTagger, tokenize
 from Adversary.utils import *
 
 
+# one entry of a compiled attack plan, applied with the given probability
+AttackStep = namedtuple('AttackStep', ['name', 'function', 'kind', 'probability', 'batch_function'])
+
+
 class Adversary:
-    def __init__(self, verbose=False, output=None):
+    def __init__(self, verbose=False, output=None, tag_cache_size=10000, tagger=None, random_seed=None,
+                 output_format='pickle', profile=False, progress=None):
         """
         Initializes Adversary object that generates data-sets and conducts attacks.
 
-        :param verbose: Determines amount of output to print -- False for none, True for all
+        :param verbose: Whether progress of generate and attack is printed, if no progress reporter is given
         :type verbose: bool
         :param output: Directory of output folder with trailing slash
         :type output: Union[str, None]
+        :param tag_cache_size: Maximum number of distinct texts whose POS tags are cached -- None for unbounded, 0 to disable
+        :type tag_cache_size: Union[int, None]
+        :param tagger: Part-of-speech tagger that selects words for word attacks -- TextBlobTagger if None
+        :type tagger: Union[Adversary.taggers.Tagger, None]
+        :param random_seed: Seed of the generator that provides seeds to generate calls without a random_seed
+        :type random_seed: Union[int, None]
+        :param output_format: Format of saved output -- 'pickle', or 'parquet' or 'arrow' (which require pyarrow)
+        :type output_format: str
+        :param profile: Whether to time the stages of generate and attack and count attack calls -- True, or a Profiler
+            with callbacks
+        :type profile: Union[bool, Adversary.profiling.Profiler]
+        :param progress: Reporter that progress events of generate and attack are sent to -- one that prints at most once
+            a second if verbose, else none
+        :type progress: Union[Adversary.progress.ProgressReporter, None]
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError('Unknown output format {!r}, expected one of {}'.format(
+                output_format, ', '.join(sorted(OUTPUT_FORMATS))))
+        self.output = output
+        self.output_format = output_format
         self.save_output = partial(pickle_to_file, output=output)
-        self.print_progress = partial(polite_printer, verbose=verbose)
+        self.progress = progress if progress is not None else ProgressReporter(sinks=[print_sink] if verbose else [])
+        self.tag_cache = LRUCache(maxsize=tag_cache_size)
+        self.tagger = TextBlobTagger() if tagger is None else tagger
+        self.rng = Random(random_seed)
+        self.prediction_stats = {'requested': 0, 'predicted': 0, 'saved': 0}
+        self.evaluator = None
+        self.profiler = (profile if isinstance(profile, Profiler) else Profiler()) if profile else None
+
+    def __getstate__(self):
+        # worker processes get an empty tag cache and no progress sinks or evaluator, which may hold callbacks that
+        # cannot be pickled, and are only used by the process that owns the Adversary
+        state = self.__dict__.copy()
+        state['progress'] = ProgressReporter()
+        state['tag_cache'] = LRUCache(maxsize=self.tag_cache.maxsize)
+        state['evaluator'] = None
+        return state
 
-    def generate(self, texts, text_sample_rate=1.0, word_sample_rate=0.3, attacks='all', max_attacks=2, random_seed=None, save=False):
+    def generate(self, texts, text_sample_rate=1.0, word_sample_rate=0.3, attacks='all', max_attacks=2, random_seed=None, save=False,
+                 n_jobs=1, shard_size=1000, sampling='python'):
         """
         Generates attacked set of texts based off of original texts.
 
@@ -36,183 +82,441 @@ class Adversary:
         :type attacks: Union[str, list, dict]
         :param max_attacks: Maximum number of attacks that can be applied to a single text
         :type max_attacks: int
-        :param random_seed: Seed for calls to random module functions
+        :param random_seed: Seed that the random number generator of every shard is derived from
         :type random_seed: int
-        :param save: Whether the generated texts should be pickled as output
+        :param save: Whether the generated texts should be saved as output, in the output format
         :type save: bool
-        :return: List of tuples of generated strings in format (attacked text, list of attacks, index of original text)
+        :param n_jobs: Number of worker processes that shards are spread over -- 1 to run in-process, -1 for one per CPU
+        :type n_jobs: int
+        :param shard_size: Number of original texts per shard, each shard is seeded from random_seed and its index
+        :type shard_size: int
+        :param sampling: How sampling decisions are drawn -- 'python' for one random.Random call per decision, 'numpy'
+            for vectorised draws from a numpy.random.Generator per shard
+        :type sampling: str
+        :return: List of tuples of generated strings in format (attacked text, list of attacks, index of original text),
+            ordered by iteration, then by text
         :rtype: list
         """
-        if random_seed:
-            seed(random_seed)
+        generate_kwargs = dict(text_sample_rate=text_sample_rate, word_sample_rate=word_sample_rate, attacks=attacks,
+                               max_attacks=max_attacks, random_seed=random_seed, n_jobs=n_jobs, shard_size=shard_size,
+                               sampling=sampling, chunked=True, metadata=True)
+        if not save or self.output is None or self.output_format == 'pickle':
+            generated = self._order_by_iteration(self.iter_generate(texts, **generate_kwargs))
+            if save:
+                self.save_output('generated_text.pkl', generated)
+            return generated
 
-        text_type = type(texts[0])
+        # columnar output is written shard by shard while the texts are generated
+        with GeneratedTextWriter(self._output_path('generated_text'), format=self.output_format) as writer:
+            return self._order_by_iteration(self.iter_generate(texts, **generate_kwargs), writer)
 
-        text_attacks = list(ATTACK_MAP['text'].keys())
-        word_attacks = list(ATTACK_MAP['word'].keys())
-        config = self._read_config(attacks)
+    def _order_by_iteration(self, shards, writer=None):
+        # shards come back iteration by iteration within each shard, generate lists every text of an iteration before
+        # the next iteration starts
+        iterations = {}
+        for shard_generated in shards:
+            if writer is not None:
+                writer.write(shard_generated)
+            for row in shard_generated:
+                iterations.setdefault(row[3], []).append(row[:3])
+        return [row for iter_no in sorted(iterations) for row in iterations[iter_no]]
+
+    def iter_generate(self, texts, text_sample_rate=1.0, word_sample_rate=0.3, attacks='all', max_attacks=2, random_seed=None,
+                      n_jobs=1, shard_size=1000, chunked=False, sampling='python', metadata=False, skip_shards=0):
+        """
+        Lazily generates attacked texts, holding only the shards in progress in memory.
+
+        :param texts: Iterable of original strings, e.g. a list, a generator or an open file (lines keep their line endings)
+        :type texts: Iterable[str]
+        :param text_sample_rate: P(individual text is attacked) if in [0, 1], else, number of attacks per text
+        :type text_sample_rate: Union[int, float]
+        :param word_sample_rate: P(word_i is sampled in a given word attack | word's text is sampled)
+        :type word_sample_rate: float
+        :param attacks: Description of attack configuration
+        :type attacks: Union[str, list, dict]
+        :param max_attacks: Maximum number of attacks that can be applied to a single text
+        :type max_attacks: int
+        :param random_seed: Seed that the random number generator of every shard is derived from
+        :type random_seed: int
+        :param n_jobs: Number of worker processes that shards are spread over -- 1 to run in-process, -1 for one per CPU
+        :type n_jobs: int
+        :param shard_size: Number of original texts per shard, each shard is seeded from random_seed and its index
+        :type shard_size: int
+        :param sampling: How sampling decisions are drawn -- 'python' for one random.Random call per decision, 'numpy'
+            for vectorised draws from a numpy.random.Generator per shard
+        :type sampling: str
+        :param chunked: Whether to yield one list of tuples per shard instead of individual tuples
+        :type chunked: bool
+        :param metadata: Whether tuples also hold the iteration that generated them and the seed of their shard
+        :type metadata: bool
+        :param skip_shards: Number of leading shards whose texts are read but not attacked, e.g. to resume a run -- the
+            remaining shards keep their indices and seeds
+        :type skip_shards: int
+        :return: Tuples in format (attacked text, list of attacks, index of original text), followed by (iteration, seed)
+            if metadata, shard by shard and within each shard by iteration, then by text
+        :rtype: Iterator[Union[tuple, list]]
+        """
+        plan = self._read_config(attacks)
+        if sampling not in SAMPLERS:
+            raise ValueError('Unknown sampling mode {!r}, expected one of {}'.format(sampling, ', '.join(sorted(SAMPLERS))))
 
         if text_sample_rate > 1:
             num_iters = int(text_sample_rate)
         else:
             num_iters = 1
-        total_num = num_iters * len(texts)
+        total_num = num_iters * len(texts) if hasattr(texts, '__len__') else None
+        if random_seed is None:
+            random_seed = self.rng.getrandbits(64)
+
+        texts = iter(texts)
+        first = next(texts, None)
+        if first is None:
+            return
+        texts = chain([first], texts)
+
+        shards = ((shard, shard_no * shard_size, derive_seed(random_seed, shard_no))
+                  for shard_no, shard in islice(enumerate(iter_chunks(texts, shard_size)), skip_shards, None))
+        shard_kwargs = dict(text_type=type(first), num_iters=num_iters,
+                            text_sample_rate=text_sample_rate, word_sample_rate=word_sample_rate,
+                            max_attacks=max_attacks, sampling=sampling, metadata=metadata)
+
+        max_workers = n_jobs if n_jobs > 0 else os.cpu_count()
+        executor = None
+        if max_workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            # the synonym index is built once here and handed to the workers instead of being rebuilt by each
+            synonyms = synonym_index() if any(step.name == 'synonym' for step in plan) else None
+            # the plan goes to every worker once, rather than being pickled with each shard, so attacks and their batch
+            # functions need not be picklable where workers are forked
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                           initargs=(self, plan, synonyms))
+            results = bounded_map(executor, partial(_generate_shard_in_worker, **shard_kwargs), shards, 2 * max_workers)
+        else:
+            results = (self._profile_shard(shard, plan=plan, **shard_kwargs) for shard in shards)
+
+        # progress is reported as shards come back, which also covers shards generated by worker processes
+        skipped = num_iters * skip_shards * shard_size
+        progress = self.progress.task('generate', total=max(total_num - skipped, 0) if total_num is not None else None)
+        try:
+            for shard_generated, shard_profile in results:
+                if shard_profile is not None:
+                    self.profiler.merge(shard_profile)
+                    self.profiler.notify(shard_profile)
+                progress.update(len(shard_generated))
+                for generated in ([shard_generated] if chunked else shard_generated):
+                    yield generated
+            progress.finish()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _profile_shard(self, shard, **kwargs):
+        # every shard is profiled on its own, so worker processes can send their counts back with the shard
+        profiler = Profiler() if self.profiler is not None else None
+        generated = self._generate_shard(*shard, profiler=profiler, **kwargs)
+        return generated, profiler.results() if profiler is not None else None
+
+    def _generate_shard(self, texts, start, shard_seed, text_type, plan, num_iters, text_sample_rate, word_sample_rate, max_attacks, sampling, metadata=False, profiler=None):
+        sampler = SAMPLERS[sampling](shard_seed)
+        rng = sampler.attack_rng
+        probabilities = [step.probability for step in plan]
 
         # list of tuples containing (attacked text, list of attacks used, index of original text)
         generated = []
-        original = copy(texts)
         for iter_no in range(num_iters):
-            texts = copy(original)
-            for i in range(len(texts)):
-                if i % 100 == 0:
-                    cur_num = iter_no * len(texts) + i
-                    self.print_progress('Generating attacked version of string {} out of {}'.format(cur_num, total_num))
-                if text_sample_rate >= random():
-                    num_attacks = 0
-                    used_attacks = []
-                    sorted_attacks = sorted([tuple(c) for c in config.items()],
-                                            key=lambda a: self._precendence(a[0], word_attacks, text_attacks))
-                    for attack, pr in sorted_attacks:
-                        if pr >= random():
-                            num_attacks += 1
-                            if num_attacks > max_attacks:
-                                break
-                            used_attacks.append(attack)
-                            if attack in text_attacks:
-                                texts[i] = ATTACK_MAP['text'][attack](texts[i])
-                            elif attack in word_attacks:
-                                blob = TextBlob(texts[i]).tags
-                                words_attacked = texts[i].split()
-                                for j, word_with_tag in enumerate(blob):
-                                    if self._should_attack_word(word_with_tag[1]) and word_sample_rate >= random():
-                                        try:
-                                            words_attacked[j] = ATTACK_MAP['word'][attack](word_with_tag[0])
-                                        except IndexError:
-                                            pass
-                                texts[i] = ' '.join(words_attacked)
-                    generated.append((text_type(texts[i]), used_attacks, i))
-                else:
-                    generated.append((text_type(texts[i]), [], i))
+            # decide which attacks each text receives, then apply every step of the plan to all of its texts at once
+            with profile_stage(profiler, 'sampling', len(texts)):
+                texts_sampled = sampler.bernoulli(len(texts), text_sample_rate)
+                attacks_sampled = sampler.bernoulli_matrix(len(texts), probabilities)
+                used_attacks = [[] for _ in texts]
+                step_idxs = [[] for _ in plan]
+                for i in range(len(texts)):
+                    if texts_sampled[i]:
+                        for k in [k for k, attack_sampled in enumerate(attacks_sampled[i]) if attack_sampled][:max_attacks]:
+                            step_idxs[k].append(i)
+                            used_attacks[i].append(plan[k].name)
 
-        if save:
-            pickle_to_file('generated_text.pkl', generated)
+            attacked = list(texts)
+            for step, idxs in zip(plan, step_idxs):
+                if not idxs:
+                    continue
+                step_texts = [attacked[i] for i in idxs]
+                if step.kind == 'word':
+                    step_texts = self._attack_words(step, step_texts, word_sample_rate, sampler, profiler)
+                else:
+                    step_texts = self._apply_attack(step, step_texts, rng, profiler)
+                for i, text in zip(idxs, step_texts):
+                    attacked[i] = text
 
+            with profile_stage(profiler, 'output', len(texts)):
+                rows = [(text_type(text), used, start + i) for i, (text, used) in enumerate(zip(attacked, used_attacks))]
+                if metadata:
+                    rows = [row + (iter_no, shard_seed) for row in rows]
+                generated.extend(rows)
         return generated
 
+    def _apply_attack(self, step, items, rng, profiler=None):
+        if profiler is not None:
+            start = time.perf_counter()
+        if step.batch_function is not None:
+            attacked = step.batch_function(items, rng)
+        else:
+            attacked = [step.function(item, rng) for item in items]
+        if profiler is not None:
+            seconds = time.perf_counter() - start
+            profiler.add_attack(step.name, items, attacked, seconds)
+            profiler.add_stage(step.kind + '_attacks', seconds, len(items))
+        return attacked
+
+    def _attack_words(self, step, texts, word_sample_rate, sampler, profiler=None):
+        with profile_stage(profiler, 'tagging', len(texts)):
+            tagged = self._tag_texts(texts)
+
+        with profile_stage(profiler, 'word_sampling', len(texts)):
+            # one mask is drawn over the candidate words of all texts, then split back up per text
+            candidates = [[token for token in tokens if self._should_attack_word(token[3])] for tokens in tagged]
+            words_sampled = iter(sampler.bernoulli(sum(len(tokens) for tokens in candidates), word_sample_rate))
+            selected = [[token for token in tokens if next(words_sampled)] for tokens in candidates]
+
+        # the selected words of all texts are attacked in one call
+        words = iter(self._apply_attack(step, [token[0] for tokens in selected for token in tokens],
+                                        sampler.attack_rng, profiler))
+
+        with profile_stage(profiler, 'splicing', len(texts)):
+            # splice the attacked words in at their offsets, keeping everything between them as it was
+            attacked = []
+            for text, tokens in zip(texts, selected):
+                pieces = []
+                end = 0
+                for _, start, token_end, _ in tokens:
+                    pieces.append(text[end:start])
+                    pieces.append(next(words))
+                    end = token_end
+                pieces.append(text[end:])
+                attacked.append(''.join(pieces))
+        return attacked
+
     def _read_config(self, attacks):
         if attacks == 'all':
             config = [(t_a, 1. / len(ATTACK_MAP['text'])) for t_a in ATTACK_MAP['text']] + \
                 [(w_a, 1. / len(ATTACK_MAP['word'])) for w_a in ATTACK_MAP['word']]
-            return dict(config)
         elif isinstance(attacks, list):
             selected_text_attacks = [t_a for t_a in attacks if t_a in ATTACK_MAP['text']]
             selected_word_attacks = [w_a for w_a in attacks if w_a in ATTACK_MAP['word']]
             config = [(t_a, 1. / len(selected_text_attacks)) for t_a in selected_text_attacks] + \
                 [(w_a, 1. / len(selected_word_attacks)) for w_a in selected_word_attacks]
-            return dict(config)
         elif isinstance(attacks, dict):
-            return attacks
-
-    def _precendence(self, attack, word_attacks, text_attacks):
-        if attack in word_attacks:
-            return 2
-        elif attack == 'good_word_attack':
-            return 1
-        elif attack in text_attacks:
-            return 0
+            config = list(attacks.items())
         else:
-            return None
+            raise ValueError('Attack configuration must be \'all\', a list or a dict, got {!r}'.format(attacks))
+        return self._compile_plan(config)
+
+    def _compile_plan(self, config):
+        unknown = [attack for attack, _ in config if self._precendence(attack) is None]
+        if unknown:
+            raise ValueError('Unknown attacks: {}'.format(', '.join(unknown)))
+        plan = []
+        for attack, pr in sorted(config, key=lambda a: self._precendence(a[0])):
+            kind = 'text' if attack in ATTACK_MAP['text'] else 'word'
+            plan.append(AttackStep(attack, ATTACK_MAP[kind][attack], kind, pr, BATCH_ATTACK_MAP.get(attack)))
+        return tuple(plan)
+
+    def _precendence(self, attack):
+        return ATTACK_PRECEDENCE.get(attack)
+
+    def _tag_texts(self, texts):
+        # every text is tokenized once, its cache entry holds (token, start offset, end offset, tag) tuples
+        tags = [self.tag_cache.get(text) for text in texts]
+        missing = list(OrderedDict.fromkeys(text for text, text_tags in zip(texts, tags) if text_tags is None))
+        if missing:
+            tokenized = [tokenize(text) for text in missing]
+            token_tags = self.tagger.tag_tokens_batch([[token for token, _, _ in tokens] for tokens in tokenized])
+            tagged = dict((text, tuple(token + (tag,) for token, tag in zip(tokens, text_tags)))
+                          for text, tokens, text_tags in zip(missing, tokenized, token_tags))
+            for text, text_tags in tagged.items():
+                self.tag_cache.put(text, text_tags)
+            tags = [text_tags if text_tags is not None else tagged[text] for text, text_tags in zip(texts, tags)]
+        return tags
+
+    def profile_results(self):
+        """
+        Returns the timers and counters collected since profiling was enabled, see Adversary.profiling.Profiler.results.
+
+        :return: Dictionary with keys stages and attacks, or None if profiling is disabled
+        :rtype: Union[dict, None]
+        """
+        return self.profiler.results() if self.profiler is not None else None
+
+    def tag_cache_info(self):
+        """
+        Returns usage statistics of the POS tag cache.
+
+        :return: Dictionary with keys hits, misses, size and maxsize
+        :rtype: dict
+        """
+        return self.tag_cache.info()
 
     def _should_attack_word(self, tag):
-        return tag[0] in ['N', 'V', 'J'] or tag == 'CD'
+        return bool(tag) and (tag[0] in ['N', 'V', 'J'] or tag == 'CD')
 
-    def attack(self, texts_original, texts_generated, predict_function, save=False):
+    def attack(self, texts_original, texts_generated, predict_function=None, save=False, batch_predict_function=None,
+               batch_size=1000, max_concurrency=1, retries=0, on_retry=None, all_combinations=False, chunk_size=None,
+               evaluator=None, checkpoint=None):
         """
         Given a list of generated texts, simulate attack and return performance metrics.
 
         :param texts_original: List of original texts
         :type texts_original: list
-        :param texts_generated: List of generated texts (output of generate function)
-        :type texts_generated: list
-        :param predict_function: Function that maps strings to classification label (0 or 1)
+        :param texts_generated: Generated texts (output of generate function, or any iterable such as iter_generate)
+        :type texts_generated: Iterable[tuple]
+        :param predict_function: Function that maps strings to classification label (0 or 1), may be async
         :type predict_function: (str) -> int
-        :param save: Whether the generated metrics DataFrames should be pickled as output
+        :param save: Whether the generated metrics DataFrames should be saved as output, in the output format
         :type save: bool
+        :param batch_predict_function: Function that maps a list of strings to a sequence of labels, used instead of
+            predict_function if given
+        :type batch_predict_function: (list) -> Sequence[int]
+        :param batch_size: Maximum number of strings passed to a single batch_predict_function call
+        :type batch_size: int
+        :param max_concurrency: Maximum number of predict calls in flight at once -- calls run on a thread pool, or on an
+            event loop if the predict function is a coroutine function
+        :type max_concurrency: int
+        :param retries: Number of times a failing predict call is retried before its exception is raised
+        :type retries: int
+        :param on_retry: Hook called with (exception, attempt number, call argument) before each retry
+        :type on_retry: (Exception, int, Union[str, list]) -> None
+        :param all_combinations: Whether the group metrics list every combination of the observed attacks, including
+            combinations that never occurred, instead of only the observed groups
+        :type all_combinations: bool
+        :param chunk_size: Number of generated texts predicted and counted at a time -- None for all at once. Between
+            chunks, the labels of original texts are kept for the shards in progress if texts_generated carry metadata
+            (iter_generate(..., metadata=True)), else for every original text seen
+        :type chunk_size: Union[int, None]
+        :param evaluator: Evaluator whose counts are continued, e.g. loaded from a checkpoint -- the generated texts it
+            already counted are skipped
+        :type evaluator: Union[Adversary.metrics.MetricsEvaluator, None]
+        :param checkpoint: Path the evaluator is saved to after every chunk, see MetricsEvaluator.load
+        :type checkpoint: Union[str, None]
         :return: Two DataFrames containing performance metrics
         :rtype: (pd.DataFrame, pd.DataFrame)
         """
-        texts_original_flat = [texts_original[t_g[2]] for t_g in texts_generated]
-        texts_generated_flat = [t_g[0] for t_g in texts_generated]
-        attacks_applied = [t_g[1] for t_g in texts_generated]
-
-        original_preds = [predict_function(t_o) for t_o in texts_original_flat]
-        generated_preds = [predict_function(t_g) for t_g in texts_generated_flat]
+        # pandas and numpy are only imported once metrics are built
+        from Adversary.metrics import MetricsEvaluator
+        evaluator = MetricsEvaluator() if evaluator is None else evaluator
+        self.evaluator = evaluator
+        predict = partial(predict_texts, predict_function=predict_function,
+                          batch_predict_function=batch_predict_function, batch_size=batch_size,
+                          max_concurrency=max_concurrency, retries=retries, on_retry=on_retry)
 
-        self.print_progress('Accuracy on original texts: {}'.format(1. * sum(original_preds) / len(original_preds)))
-        self.print_progress('Accuracy on generated texts: {}'.format(1. * sum(generated_preds) / len(generated_preds)))
+        total = len(texts_generated) - evaluator.num_texts if hasattr(texts_generated, '__len__') else None
+        texts_generated = islice(texts_generated, evaluator.num_texts, None)
+        chunks = [list(texts_generated)] if chunk_size is None else iter_chunks(texts_generated, chunk_size)
+        profiler = Profiler() if self.profiler is not None else None
+        for _ in self.iter_evaluate(chunks, texts_original, predict, evaluator, total=total, profiler=profiler):
+            if checkpoint is not None:
+                evaluator.save(checkpoint)
 
-        misclassifications_single = self._get_misclassifications_single(original_preds, generated_preds, attacks_applied)
-        misclassifications_group = self._get_misclassifications_group(original_preds, generated_preds, attacks_applied)
+        with profile_stage(profiler, 'metrics'):
+            misclassifications_df_single = evaluator.misclassifications_single()
+            misclassifications_df_group = evaluator.misclassifications_group(all_combinations=all_combinations)
+        if profiler is not None:
+            self.profiler.merge(profiler)
+            self.profiler.notify(profiler.results())
 
         if save:
-            pickle_to_file('misclassifications_df_single.pkl', misclassifications_single)
-            pickle_to_file('misclassifications_df_group.pkl', misclassifications_group)
+            self._save_dataframe('misclassifications_df_single', misclassifications_df_single)
+            self._save_dataframe('misclassifications_df_group', misclassifications_df_group)
+
+        return misclassifications_df_single, misclassifications_df_group
 
-        return misclassifications_single, misclassifications_group
+    def iter_evaluate(self, chunks, texts_original, predict, evaluator, total=None, profiler=None):
+        """
+        Predicts the original and generated texts of every chunk and counts them into evaluator, reporting progress and
+        prediction_stats as attack does. attack runs on it, and it lets callers act between chunks, e.g. write them out
+        or checkpoint the evaluator.
+
+        :param chunks: Iterable of lists of generated text tuples, as yielded by iter_generate
+        :type chunks: Iterable[list]
+        :param texts_original: Original texts, indexable by the original index of the generated texts
+        :type texts_original: Union[list, Mapping[int, str]]
+        :param predict: Function that maps a list of texts to a list of labels, see prediction.predict_texts
+        :type predict: (list) -> list
+        :param evaluator: Evaluator the chunks are counted into
+        :type evaluator: Adversary.metrics.MetricsEvaluator
+        :param total: Number of generated texts, if known
+        :type total: Union[int, None]
+        :param profiler: Profiler the predict and metrics stages are timed in
+        :type profiler: Union[Adversary.profiling.Profiler, None]
+        :return: Iterator over the chunks, each yielded once it is counted
+        :rtype: Iterator[list]
+        """
+        progress = self.progress.task('attack', total=total)
+        original_preds_of = {}
+        originals_of_shard = {}
+        self.prediction_stats = {'requested': 0, 'predicted': 0, 'saved': 0}
+        for chunk in chunks:
+            # each distinct string, original or generated, is predicted once and fanned back out to its occurrences
+            with profile_stage(profiler, 'predict', 2 * len(chunk)):
+                seed_of = dict((t_g[2], t_g[4]) for t_g in chunk) if chunk and len(chunk[0]) > 4 else None
+                if seed_of is not None:
+                    # texts with metadata come shard by shard, so shards missing from this chunk have been passed
+                    for seed in [seed for seed in originals_of_shard if seed not in seed_of.values()]:
+                        for i in originals_of_shard.pop(seed):
+                            del original_preds_of[i]
+                original_idxs = list(OrderedDict.fromkeys(t_g[2] for t_g in chunk if t_g[2] not in original_preds_of))
+                texts_chunk = [texts_original[i] for i in original_idxs] + [t_g[0] for t_g in chunk]
+                preds, num_predicted = predict_distinct(texts_chunk, predict)
+                original_preds_of.update(zip(original_idxs, preds[:len(original_idxs)]))
+                if seed_of is not None:
+                    for i in original_idxs:
+                        originals_of_shard.setdefault(seed_of[i], []).append(i)
+            with profile_stage(profiler, 'metrics', len(chunk)):
+                evaluator.update(chunk, [original_preds_of[t_g[2]] for t_g in chunk], preds[len(original_idxs):])
+
+            self.prediction_stats['requested'] += 2 * len(chunk)
+            self.prediction_stats['predicted'] += num_predicted
+            self.prediction_stats['saved'] = self.prediction_stats['requested'] - self.prediction_stats['predicted']
+            progress.update(len(chunk))
+            yield chunk
+
+        num_texts = max(evaluator.num_texts, 1)
+        progress.finish(accuracy_on_original_texts=1. * evaluator.num_original_positive / num_texts,
+                        accuracy_on_generated_texts=1. * evaluator.num_generated_positive / num_texts,
+                        model_calls=self.prediction_stats['predicted'], saved_model_calls=self.prediction_stats['saved'])
+
+    def _output_path(self, name):
+        return self.output + name + OUTPUT_FORMATS[self.output_format]
+
+    def _save_dataframe(self, name, df):
+        if self.output is None:
+            return
+        if self.output_format == 'pickle':
+            self.save_output(name + '.pkl', df)
+        else:
+            write_dataframe(self._output_path(name), df, format=self.output_format)
 
     def _get_misclassifications_single(self, original_preds, generated_preds, attacks_applied):
-        results = zip(original_preds, generated_preds, attacks_applied)
-        misclassifications_single = dict([(att, 0) for att in flatten_unique(attacks_applied)])
-        always_wrong_single = copy(misclassifications_single)
-        never_wrong_single = copy(misclassifications_single)
-
-        for i, res in enumerate(results):
-            original, generated, applied = res[0], res[1], res[2]
-            if original == 1 and generated == 0:
-                for attack in applied:
-                    misclassifications_single[attack] += 1
-            elif original == 1 and generated == 1:
-                for attack in applied:
-                    always_wrong_single[attack] += 1
-            elif original == 0 and generated == 0:
-                for attack in applied:
-                    never_wrong_single[attack] += 1
-
-        index_fancy = fancy_titles(misclassifications_single.keys())
-        return pd.DataFrame(
-            list(zip(misclassifications_single.values(), always_wrong_single.values(), never_wrong_single.values())),
-            index=index_fancy,
-            columns=['Caused Misclassifications', 'Always Misclassified', 'Never Misclassified']
-        ).rename_axis('Attack')
-
-    def _get_misclassifications_group(self, original_preds, generated_preds, attacks_applied):
-        results = list(zip(original_preds, generated_preds, attacks_applied))
-        attacks_used = flatten_unique(attacks_applied)
-        misclassifications_group = dict([(','.join(sorted(att)), 0) for att in attacks_applied])
-        always_wrong_group = copy(misclassifications_group)
-        never_wrong_group = copy(misclassifications_group)
-        for i, res in enumerate(results):
-            original, generated, applied = res[0], res[1], res[2]
-            if original == 1 and generated == 0:
-                misclassifications_group[','.join(sorted(applied))] += 1
-            elif original == 1 and generated == 1:
-                always_wrong_group[','.join(sorted(applied))] += 1
-            elif original == 0 and generated == 0:
-                never_wrong_group[','.join(sorted(applied))] += 1
-
-        cols = sorted(attacks_used) + ['Caused Misclassifications', 'Always Misclassified', 'Never Misclassified']
-        all_combos = combinations_of_len(attacks_used, max([len(res[2]) for res in results]))
-        misclassifications_df_list = []
-        for i, combo in enumerate(all_combos):
-            row = [' '] * len(cols)
-            for att in combo:
-                row[cols.index(att)] = 'X'
-            row[-3] = misclassifications_group.get(','.join(sorted(combo)), 0)
-            row[-2] = never_wrong_group.get(','.join(sorted(combo)), 0)
-            row[-1] = always_wrong_group.get(','.join(sorted(combo)), 0)
-            misclassifications_df_list.append(row)
-        misclassifications_df_list = sorted(misclassifications_df_list, key=lambda x: x[-3], reverse=True)
-
-        cols_fancy = fancy_titles(cols)
-        df = pd.DataFrame(misclassifications_df_list, columns=cols_fancy)
-        return df
+        from Adversary.metrics import group_outcome_counts, misclassifications_single
+        groups, counts = group_outcome_counts(original_preds, generated_preds, attacks_applied)
+        return misclassifications_single(groups, counts)
+
+    def _get_misclassifications_group(self, original_preds, generated_preds, attacks_applied, all_combinations=False):
+        from Adversary.metrics import group_outcome_counts, misclassifications_group
+        groups, counts = group_outcome_counts(original_preds, generated_preds, attacks_applied)
+        return misclassifications_group(groups, counts, all_combinations=all_combinations)
+
+
+_worker_adversary = None
+_worker_plan = None
+
+
+def _init_worker(adversary, plan, synonyms=None):
+    global _worker_adversary, _worker_plan
+    _worker_adversary = adversary
+    _worker_plan = plan
+    if synonyms is not None:
+        set_synonym_index(synonyms)
+
+
+def _generate_shard_in_worker(shard, **kwargs):
+    return _worker_adversary._profile_shard(shard, plan=_worker_plan, **kwargs)
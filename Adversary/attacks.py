@@ -1,113 +1,359 @@
-from random import choice, randint, sample, randrange
-from string import punctuation
+import io
+import random
+from collections import OrderedDict
+from string import ascii_letters, digits, punctuation
 
 from Adversary.constants import *
+from Adversary.constants import lazy_constant
+from Adversary.synonyms import SynonymIndex, set_synonym_index, synonym_index
+
+'''Keeps track of all attacks, their types, precedences and batch implementations'''
+
+# attacks with a lower precedence are applied to a text first
+DEFAULT_PRECEDENCE = {'text': 0, 'word': 2}
+
+ATTACK_MAP = {'text': {}, 'word': {}}
+ATTACK_PRECEDENCE = {}
+BATCH_ATTACK_MAP = {}
+
+
+def register_attack(function, kind, name=None, precedence=None, batch=None):
+    """
+    Registers an attack so it can be selected in attack configurations.
+
+    :param function: Attack that maps a text (or word) and an optional rng to the attacked text (or word)
+    :type function: (str, random.Random) -> str
+    :param kind: Whether the attack acts on a whole text ('text') or on single words within a text ('word')
+    :type kind: str
+    :param name: Name of the attack in configurations -- the function's name if None
+    :type name: Union[str, None]
+    :param precedence: Attacks with lower precedence are applied first -- 0 for text and 2 for word attacks if None
+    :type precedence: Union[int, None]
+    :param batch: Optional vectorised implementation that maps a list of texts (or words) and an rng to a list of results
+    :type batch: Union[(list, random.Random) -> list, None]
+    :return: The registered attack function
+    :rtype: (str, random.Random) -> str
+    """
+    if kind not in ATTACK_MAP:
+        raise ValueError('Attack kind must be one of {}, got {!r}'.format(', '.join(sorted(ATTACK_MAP)), kind))
+    name = function.__name__ if name is None else name
+    unregister_attack(name)
+    ATTACK_MAP[kind][name] = function
+    ATTACK_PRECEDENCE[name] = DEFAULT_PRECEDENCE[kind] if precedence is None else precedence
+    if batch is not None:
+        BATCH_ATTACK_MAP[name] = batch
+    return function
+
+
+def unregister_attack(name):
+    for attacks in ATTACK_MAP.values():
+        attacks.pop(name, None)
+    ATTACK_PRECEDENCE.pop(name, None)
+    BATCH_ATTACK_MAP.pop(name, None)
+
+
+def text_attack(name=None, precedence=DEFAULT_PRECEDENCE['text'], batch=None):
+    """
+    Decorator that registers a function acting on a single text as an attack, see register_attack.
+    """
+    return lambda function: register_attack(function, 'text', name=name, precedence=precedence, batch=batch)
+
+
+def word_attack(name=None, precedence=DEFAULT_PRECEDENCE['word'], batch=None):
+    """
+    Decorator that registers a function acting on a single word within a text as an attack, see register_attack.
+    """
+    return lambda function: register_attack(function, 'word', name=name, precedence=precedence, batch=batch)
+
+
+def batch_attack(name):
+    """
+    Decorator that registers a function as the vectorised implementation of the already registered attack name.
+    """
+    def decorator(batch_function):
+        if name not in ATTACK_PRECEDENCE:
+            raise ValueError('Unknown attack: {}'.format(name))
+        BATCH_ATTACK_MAP[name] = batch_function
+        return batch_function
+    return decorator
+
+
+'''Every attack draws from rng, a random.Random instance, or from the random module if rng is None'''
 
 '''These act on a single text'''
 
 
-def good_word_attack(text):
-    if randint(1, 2) == 1:
-        return text + ' ' + ' '.join(sample(NEUTRAL_WORDS, randint(5, 15)))
+@text_attack(precedence=1)
+def good_word_attack(text, rng=None):
+    rng = rng or random
+    if rng.randint(1, 2) == 1:
+        return text + ' ' + ' '.join(rng.sample(load_neutral_words(), rng.randint(5, 15)))
     else:
-        return ' '.join(sample(NEUTRAL_WORDS, randint(2, 10))) + ' ' + text
+        return ' '.join(rng.sample(load_neutral_words(), rng.randint(2, 10))) + ' ' + text
 
 
-def swap_words(text):
+@text_attack()
+def swap_words(text, rng=None):
+    rng = rng or random
     words = text.split()
     if len(words) <= 3:
         return ' '.join(words)
     swapped = list(range(len(words)))
-    idxs = sample(range(1, len(words) - 2), randint(1, min(3, len(words) // 2 - 1)))
+    idxs = rng.sample(range(1, len(words) - 2), rng.randint(1, min(3, len(words) // 2 - 1)))
     for i in idxs:
         swapped[i], swapped[i + 1] = swapped[i + 1], swapped[i]
     return ' '.join([words[i] for i in swapped])
 
 
-def remove_spacing(text):
+@text_attack()
+def remove_spacing(text, rng=None):
+    rng = rng or random
     chars = list(text)
     for i, c in enumerate(chars):
-        if c == ' ' and randint(1, 3) == 1:
-            chars[i] = choice(',.-'"`*")
+        if c == ' ' and rng.randint(1, 3) == 1:
+            chars[i] = rng.choice(',.-'"`*")
     return ''.join(chars)
 
 
-'''These act on a single word within a text'''
+'''These act on a single word within a text, and their batch versions on many words at once'''
+
+
+@word_attack()
+def synonym(word, rng=None):
+    rng = rng or random
+    return rng.choice(synonym_index().candidates(word) or [word])
+
+
+@batch_attack('synonym')
+def synonym_batch(words, rng=None):
+    choice = (rng or random).choice
+    candidates = synonym_index().candidates
+    return [choice(candidates(word) or [word]) for word in words]
+
+
+# homoglyph options per character, for both cases, so words need no lowercasing per character
+HOMOGLYPH_OPTIONS = dict(HOMOGLPYH_MAP)
+HOMOGLYPH_OPTIONS.update((c.upper(), options) for c, options in HOMOGLPYH_MAP.items())
+
+_homoglyph_tables = None
+
 
+def build_homoglyph_tables(num_tables=64, homoglyphs=None, random_seed=0):
+    """
+    Builds translation tables that each replace every character with one randomly chosen homoglyph.
 
-def synonym(word):
-    return choice(SYNONYMS.get(word, [word]))
+    :param num_tables: Number of tables to build, letter_to_symbol picks one of them per word
+    :type num_tables: int
+    :param homoglyphs: Mapping of character to string of characters that look like it -- HOMOGLYPH_OPTIONS if None
+    :type homoglyphs: Union[dict, None]
+    :param random_seed: Seed for choosing the homoglyphs, so every process builds the same tables
+    :type random_seed: int
+    :return: List of str.translate tables
+    :rtype: list
+    """
+    homoglyphs = HOMOGLYPH_OPTIONS if homoglyphs is None else homoglyphs
+    rng = random.Random(random_seed)
+    return [dict((ord(c), rng.choice(options)) for c, options in sorted(homoglyphs.items()) if options)
+            for _ in range(num_tables)]
 
 
-def letter_to_symbol(word):
-    return ''.join([choice(HOMOGLPYH_MAP.get(c.lower(), [c])) for c in word])
+def set_homoglyph_tables(num_tables=64, homoglyphs=None, random_seed=0):
+    """
+    Replaces the translation tables used by letter_to_symbol, see build_homoglyph_tables.
 
+    :return: List of str.translate tables
+    :rtype: list
+    """
+    global _homoglyph_tables
+    _homoglyph_tables = build_homoglyph_tables(num_tables, homoglyphs, random_seed)
+    return _homoglyph_tables
 
-def swap_letters(word):
+
+def homoglyph_tables():
+    if _homoglyph_tables is None:
+        return set_homoglyph_tables()
+    return _homoglyph_tables
+
+
+def load_confusables(path, targets=ascii_letters + digits):
+    """
+    Reads homoglyphs from a local copy of Unicode's confusables.txt (https://www.unicode.org/Public/security/latest/).
+
+    :param path: Path of the confusables file
+    :type path: str
+    :param targets: Characters to collect homoglyphs for
+    :type targets: str
+    :return: Mapping of character to string of single characters that are confusable with it
+    :rtype: dict
+    """
+    confusables = {}
+    with io.open(path, encoding='utf-8-sig') as f:
+        for line in f:
+            fields = line.split('#', 1)[0].split(';')
+            if len(fields) < 2:
+                continue
+            source, target = [''.join(chr(int(code, 16)) for code in field.split()) for field in fields[:2]]
+            if len(source) == 1 and target in targets and len(target) == 1 and source not in confusables.get(target, ''):
+                confusables[target] = confusables.get(target, target) + source
+    return confusables
+
+
+def merge_homoglyphs(*homoglyph_maps):
+    merged = {}
+    for homoglyphs in homoglyph_maps:
+        for c, options in homoglyphs.items():
+            merged[c] = ''.join(OrderedDict.fromkeys(merged.get(c, '') + options))
+    return merged
+
+
+@word_attack()
+def letter_to_symbol(word, rng=None):
+    return word.translate((rng or random).choice(homoglyph_tables()))
+
+
+@batch_attack('letter_to_symbol')
+def letter_to_symbol_batch(words, rng=None):
+    choice = (rng or random).choice
+    tables = homoglyph_tables()
+    return [word.translate(choice(tables)) for word in words]
+
+
+@word_attack()
+def swap_letters(word, rng=None):
+    rng = rng or random
     if len(word) < 4:
         return word
     swapped = list(range(len(word)))
-    max_swap = randint(1, min(3, len(word) // 2 - 1))
-    idxs = sample(range(1, len(word) - 2), max_swap)
+    max_swap = rng.randint(1, min(3, len(word) // 2 - 1))
+    idxs = rng.sample(range(1, len(word) - 2), max_swap)
     for i in idxs:
         swapped[i], swapped[i + 1] = swapped[i + 1], swapped[i]
     return ''.join([word[i] for i in swapped])
 
 
-def insert_punctuation(word):
+@batch_attack('swap_letters')
+def swap_letters_batch(words, rng=None):
+    rng = rng or random
+    randint, sample = rng.randint, rng.sample
+    attacked = []
+    for word in words:
+        if len(word) < 4:
+            attacked.append(word)
+            continue
+        chars = list(word)
+        for i in sample(range(1, len(word) - 2), randint(1, min(3, len(word) // 2 - 1))):
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+        attacked.append(''.join(chars))
+    return attacked
+
+
+@word_attack()
+def insert_punctuation(word, rng=None):
+    rng = rng or random
     word_with_punct = list(word)
     for _ in range(2):
-        word_with_punct.insert(randrange(len(word_with_punct)), choice(punctuation))
+        word_with_punct.insert(rng.randrange(len(word_with_punct)), rng.choice(punctuation))
     return ''.join(word_with_punct)
 
 
-def insert_duplicate_characters(word):
+@batch_attack('insert_punctuation')
+def insert_punctuation_batch(words, rng=None):
+    rng = rng or random
+    randrange, choice = rng.randrange, rng.choice
+    attacked = []
+    for word in words:
+        i = randrange(len(word))
+        word = word[:i] + choice(punctuation) + word[i:]
+        i = randrange(len(word))
+        attacked.append(word[:i] + choice(punctuation) + word[i:])
+    return attacked
+
+
+@word_attack()
+def insert_duplicate_characters(word, rng=None):
+    rng = rng or random
     word_with_dupes = list(word)
     for _ in range(2):
-        i = randrange(len(word_with_dupes))
+        i = rng.randrange(len(word_with_dupes))
         word_with_dupes.insert(i, word_with_dupes[i])
     return ''.join(word_with_dupes)
 
 
-def delete_characters(word):
+@batch_attack('insert_duplicate_characters')
+def insert_duplicate_characters_batch(words, rng=None):
+    randrange = (rng or random).randrange
+    attacked = []
+    for word in words:
+        i = randrange(len(word))
+        word = word[:i + 1] + word[i:]
+        i = randrange(len(word))
+        attacked.append(word[:i + 1] + word[i:])
+    return attacked
+
+
+@word_attack()
+def delete_characters(word, rng=None):
+    rng = rng or random
     if len(word) < 4:
         return word
     max_del = 1 if len(word) <= 5 else 2
-    idxs_delete = sample(range(1, len(word) - 1), max_del)
+    idxs_delete = rng.sample(range(1, len(word) - 1), max_del)
     return ''.join([c for i, c in enumerate(
         list(word)) if i not in idxs_delete])
 
 
-def change_case(word):
+@batch_attack('delete_characters')
+def delete_characters_batch(words, rng=None):
+    sample = (rng or random).sample
+    attacked = []
+    for word in words:
+        if len(word) < 4:
+            attacked.append(word)
+        elif len(word) <= 5:
+            i, = sample(range(1, len(word) - 1), 1)
+            attacked.append(word[:i] + word[i + 1:])
+        else:
+            i, j = sorted(sample(range(1, len(word) - 1), 2))
+            attacked.append(word[:i] + word[i + 1:j] + word[j + 1:])
+    return attacked
+
+
+@word_attack()
+def change_case(word, rng=None):
+    rng = rng or random
     word_with_changed_case = list(word)
-    idx = sample(range(len(word)), randint(1, len(word)))
+    idx = rng.sample(range(len(word)), rng.randint(1, len(word)))
     for i in idx:
         c = word[i]
         word_with_changed_case[i] = c.upper() if c.lower() == c else c.lower()
     return ''.join(word_with_changed_case)
 
 
-def num_to_word(word):
+@batch_attack('change_case')
+def change_case_batch(words, rng=None):
+    rng = rng or random
+    randint, sample = rng.randint, rng.sample
+    attacked = []
+    for word in words:
+        chars = list(word)
+        for i in sample(range(len(word)), randint(1, len(word))):
+            c = chars[i]
+            chars[i] = c.upper() if c.lower() == c else c.lower()
+        attacked.append(''.join(chars))
+    return attacked
+
+
+@word_attack()
+def num_to_word(word, rng=None):
     return NUM_TO_WORD.get(word, word)
 
 
-'''Keeps track of all attacks and their types'''
-
-
-ATTACK_MAP = {
-    'text': {
-        'good_word_attack': good_word_attack,
-        'swap_words': swap_words,
-        'remove_spacing': remove_spacing,
-    },
-    'word': {
-        'synonym': synonym,
-        'letter_to_symbol': letter_to_symbol,
-        'swap_letters': swap_letters,
-        'insert_punctuation': insert_punctuation,
-        'insert_duplicate_characters': insert_duplicate_characters,
-        'delete_characters': delete_characters,
-        'change_case': change_case,
-        'num_to_word': num_to_word
-    }
-}
+@batch_attack('num_to_word')
+def num_to_word_batch(words, rng=None):
+    get = NUM_TO_WORD.get
+    return [get(word, word) for word in words]
+
+
+def __getattr__(name):
+    # SYNONYMS and NEUTRAL_WORDS are loaded on first access, as they were reachable here through star imports
+    return lazy_constant(__name__, name)
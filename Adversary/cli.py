@@ -0,0 +1,223 @@
+import argparse
+import csv
+import importlib
+import importlib.util
+import io
+import json
+import os
+import sys
+from functools import partial
+from random import Random
+
+from Adversary.adversary import Adversary
+from Adversary.output import GeneratedTextWriter, write_dataframe
+from Adversary.prediction import predict_texts
+from Adversary.taggers import LexiconTagger, TextBlobTagger
+
+'''Command-line batch runner that generates attacked texts from a file and optionally scores them with a model
+
+    python -m Adversary texts.jsonl output/ --config attacks.yaml --model model.py:predict --jobs 4
+'''
+
+INPUT_FORMATS = ['jsonl', 'csv', 'parquet']
+OUTPUT_EXTENSIONS = {'jsonl': '.jsonl', 'parquet': '.parquet', 'arrow': '.arrow'}
+GENERATE_OPTIONS = ['text_sample_rate', 'word_sample_rate', 'max_attacks', 'random_seed', 'sampling']
+TAGGERS = {'textblob': TextBlobTagger, 'lexicon': LexiconTagger}
+CHECKPOINT_FILE = 'checkpoint.json'
+
+
+def read_texts(path, format=None, column='text'):
+    """
+    Streams texts from a JSON lines, CSV or Parquet file.
+
+    :param path: Path of the file
+    :type path: str
+    :param format: One of jsonl, csv and parquet -- inferred from the file extension if None
+    :type format: Union[str, None]
+    :param column: Field (JSON lines, where lines may also be plain JSON strings) or column (CSV, Parquet) holding the text
+    :type column: str
+    :return: Iterator over the texts
+    :rtype: Iterator[str]
+    """
+    format = format or os.path.splitext(path)[1].lstrip('.').lower()
+    if format == 'jsonl':
+        with io.open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record if isinstance(record, str) else record[column]
+    elif format == 'csv':
+        with io.open(path, encoding='utf-8', newline='') as f:
+            for record in csv.DictReader(f):
+                yield record[column]
+    elif format == 'parquet':
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(columns=[column]):
+            for text in batch.column(0).to_pylist():
+                yield text
+    else:
+        raise ValueError('Unknown input format {!r}, expected one of {}'.format(format, ', '.join(INPUT_FORMATS)))
+
+
+def read_config(path):
+    """
+    Reads a YAML attack configuration, which is either a list of attacks, a mapping of attack to probability, or a
+    mapping with an 'attacks' entry (in either form) next to generate options such as word_sample_rate.
+
+    :return: Attack configuration and dict of generate options
+    :rtype: (Union[str, list, dict], dict)
+    """
+    import yaml
+    with io.open(path, encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    if isinstance(config, dict) and 'attacks' in config:
+        unknown = [key for key in config if key != 'attacks' and key not in GENERATE_OPTIONS]
+        if unknown:
+            raise ValueError('Unknown options in {}: {}'.format(path, ', '.join(unknown)))
+        return config['attacks'], dict((key, config[key]) for key in GENERATE_OPTIONS if key in config)
+    return config, {}
+
+
+def load_function(spec):
+    """
+    Loads a function from a 'module:function' or 'path/to/file.py:function' spec.
+    """
+    module_name, _, function_name = spec.rpartition(':')
+    if not module_name or not function_name:
+        raise ValueError('Model must be given as module:function or path/to/file.py:function, got {!r}'.format(spec))
+    if module_name.endswith('.py') or os.sep in module_name:
+        module_spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(module_name))[0],
+                                                             module_name)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+    return getattr(module, function_name)
+
+
+def write_part(path, rows, format):
+    if format == 'jsonl':
+        with io.open(path, 'w', encoding='utf-8') as f:
+            for text, attacks, original_index, iteration, seed in rows:
+                f.write(json.dumps({'attacked_text': text, 'attacks': attacks, 'original_index': original_index,
+                                    'iteration': iteration, 'seed': seed}) + '\n')
+    else:
+        with GeneratedTextWriter(path, format=format) as writer:
+            writer.write(rows)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m Adversary', description='Generates attacked versions of texts in a '
+                                     'file, and optionally measures how often they change a model\'s predictions.')
+    parser.add_argument('input', help='JSON lines, CSV or Parquet file of original texts')
+    parser.add_argument('output', help='Directory that parts of generated texts, metrics and the checkpoint go to')
+    parser.add_argument('--input-format', choices=INPUT_FORMATS, help='Inferred from the file extension by default')
+    parser.add_argument('--column', default='text', help='Field or column holding the texts (default: text)')
+    parser.add_argument('--config', help='YAML attack configuration (default: all attacks)')
+    parser.add_argument('--text-sample-rate', type=float)
+    parser.add_argument('--word-sample-rate', type=float)
+    parser.add_argument('--max-attacks', type=int)
+    parser.add_argument('--seed', type=int, dest='random_seed')
+    parser.add_argument('--sampling', choices=['python', 'numpy'])
+    parser.add_argument('--tagger', choices=sorted(TAGGERS), default='textblob')
+    parser.add_argument('--model', help='Predict function as module:function or path/to/file.py:function')
+    parser.add_argument('--batch-model', action='store_true', help='The model maps a list of texts to a list of labels')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--max-concurrency', type=int, default=1)
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes, -1 for one per CPU (default: 1)')
+    parser.add_argument('--chunk-size', type=int, default=1000,
+                        help='Original texts per shard, every shard is written to its own part file (default: 1000)')
+    parser.add_argument('--output-format', choices=sorted(OUTPUT_EXTENSIONS), default='jsonl')
+    parser.add_argument('--resume', action='store_true', help='Continue after the last part in the output checkpoint')
+    parser.add_argument('--verbose', action='store_true')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    attacks, options = read_config(args.config) if args.config else ('all', {})
+    options.update((key, getattr(args, key)) for key in GENERATE_OPTIONS if getattr(args, key) is not None)
+
+    if not os.path.isdir(args.output):
+        os.makedirs(args.output)
+    checkpoint_path = os.path.join(args.output, CHECKPOINT_FILE)
+    # everything that changes the generated parts or the counts they are folded into must match on resume
+    settings = dict((key, value) for key, value in options.items() if key != 'random_seed')
+    settings.update(attacks=attacks, tagger=args.tagger, chunk_size=args.chunk_size, output_format=args.output_format,
+                    model=args.model, batch_model=args.batch_model)
+    checkpoint = {'shards_done': 0, 'evaluator': None}
+    if args.resume and os.path.exists(checkpoint_path):
+        with io.open(checkpoint_path, encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        previous = checkpoint['settings']
+        differing = [(key, previous.get(key), settings.get(key)) for key in sorted(set(settings) | set(previous))
+                     if settings.get(key) != previous.get(key)]
+        if options.get('random_seed') not in (None, checkpoint['random_seed']):
+            differing.append(('random_seed', checkpoint['random_seed'], options['random_seed']))
+        if differing:
+            raise ValueError('Checkpoint was written with different settings: {}'.format(
+                ', '.join('{} {!r} (now {!r})'.format(*setting) for setting in differing)))
+        options['random_seed'] = checkpoint['random_seed']
+    elif options.get('random_seed') is None:
+        # the seed is fixed up front and checkpointed, so resumed runs generate the same texts
+        options['random_seed'] = Random().getrandbits(63)
+
+    predict = None
+    evaluator = None
+    if args.model:
+        # pandas and numpy are only imported when metrics are computed
+        from Adversary.metrics import MetricsEvaluator
+        model = load_function(args.model)
+        predict = partial(predict_texts, predict_function=None if args.batch_model else model,
+                          batch_predict_function=model if args.batch_model else None, batch_size=args.batch_size,
+                          max_concurrency=args.max_concurrency)
+        evaluator = MetricsEvaluator.from_state(checkpoint['evaluator']) if checkpoint['evaluator'] else MetricsEvaluator()
+
+    # originals are held only until the shard that read them has been scored
+    originals = {}
+    first_shard = checkpoint['shards_done']
+
+    def record_originals(texts):
+        for i, text in enumerate(texts):
+            if predict is not None and i >= first_shard * args.chunk_size:
+                originals[i] = text
+            yield text
+
+    def write_parts(shards):
+        for shard_no, rows in enumerate(shards, first_shard):
+            write_part(os.path.join(args.output, 'part-{:05d}{}'.format(shard_no, OUTPUT_EXTENSIONS[args.output_format])),
+                       rows, args.output_format)
+            yield rows
+
+    adversary = Adversary(verbose=args.verbose, tagger=TAGGERS[args.tagger]())
+    shards = adversary.iter_generate(record_originals(read_texts(args.input, args.input_format, args.column)),
+                                     attacks=attacks, n_jobs=args.jobs, shard_size=args.chunk_size, chunked=True,
+                                     metadata=True, skip_shards=first_shard, **options)
+    parts = write_parts(shards)
+    if predict is not None:
+        # every part is scored as attack scores its chunks, with the same progress reports and prediction_stats
+        parts = adversary.iter_evaluate(parts, originals, predict, evaluator)
+    for shard_no, rows in enumerate(parts, first_shard + 1):
+        if predict is not None:
+            for i in set(row[2] for row in rows):
+                del originals[i]
+
+        checkpoint = {'shards_done': shard_no, 'random_seed': options['random_seed'], 'settings': settings,
+                      'evaluator': evaluator.state() if evaluator is not None else None}
+        with io.open(checkpoint_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(checkpoint_path + '.tmp', checkpoint_path)
+
+    if evaluator is not None:
+        for name, df in [('misclassifications_single', evaluator.misclassifications_single()),
+                         ('misclassifications_group', evaluator.misclassifications_group())]:
+            if args.output_format == 'jsonl':
+                df.to_csv(os.path.join(args.output, name + '.csv'))
+            else:
+                write_dataframe(os.path.join(args.output, name + OUTPUT_EXTENSIONS[args.output_format]), df,
+                                format=args.output_format)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from Adversary.utils import combinations_of_len, fancy_titles
+
+'''Columnar computation of misclassification metrics from predictions on original and generated texts'''
+
+OUTCOME_COLUMNS = ['Caused Misclassifications', 'Always Misclassified', 'Never Misclassified']
+
+
+def group_outcome_counts(original_preds, generated_preds, attacks_applied):
+    """
+    Counts outcomes per observed group of applied attacks.
+
+    :param original_preds: Labels predicted for the original text of every generated text
+    :type original_preds: Sequence[int]
+    :param generated_preds: Labels predicted for every generated text
+    :type generated_preds: Sequence[int]
+    :param attacks_applied: List of attacks applied to every generated text
+    :type attacks_applied: Sequence[list]
+    :return: Sorted attack tuple of every observed group, and an array with one row of outcome counts per group in the
+        order caused misclassification, always misclassified, never misclassified
+    :rtype: (list, np.ndarray)
+    """
+    group_ids = {}
+    groups = []
+    group_of_key = {}
+    row_groups = np.empty(len(attacks_applied), dtype=np.int64)
+    for i, applied in enumerate(attacks_applied):
+        key = tuple(applied)
+        group = group_of_key.get(key)
+        if group is None:
+            combo = tuple(sorted(set(key)))
+            group = group_ids.get(combo)
+            if group is None:
+                group = group_ids[combo] = len(groups)
+                groups.append(combo)
+            group_of_key[key] = group
+        row_groups[i] = group
+
+    original = np.asarray(original_preds)
+    generated = np.asarray(generated_preds)
+    outcomes = np.stack([(original == 1) & (generated == 0),
+                         (original == 1) & (generated == 1),
+                         (original == 0) & (generated == 0)], axis=1)
+    counts = np.stack([np.bincount(row_groups, weights=outcomes[:, k], minlength=len(groups))
+                       for k in range(outcomes.shape[1])], axis=1).astype(np.int64)
+    return groups, counts
+
+
+def attack_matrix(groups, attacks):
+    """
+    Builds the multi-hot matrix marking which attacks (columns) make up each group (rows).
+    """
+    col_of = dict((attack, j) for j, attack in enumerate(attacks))
+    matrix = np.zeros((len(groups), len(attacks)), dtype=np.int64)
+    for i, combo in enumerate(groups):
+        matrix[i, [col_of[attack] for attack in combo]] = 1
+    return matrix
+
+
+def misclassifications_single(groups, counts):
+    attacks = sorted(set(attack for combo in groups for attack in combo))
+    single_counts = attack_matrix(groups, attacks).T.dot(counts) if groups else np.zeros((0, len(OUTCOME_COLUMNS)))
+    return pd.DataFrame(
+        single_counts,
+        index=fancy_titles(attacks),
+        columns=OUTCOME_COLUMNS
+    ).rename_axis('Attack')
+
+
+def misclassifications_group(groups, counts, all_combinations=False):
+    """
+    Builds the table of outcome counts per group of attacks, sorted by caused misclassifications.
+
+    :param groups: Sorted attack tuple of every observed group
+    :type groups: list
+    :param counts: Array with one row of outcome counts per group
+    :type counts: np.ndarray
+    :param all_combinations: Whether to include a row for every combination of observed attacks up to the largest group
+        size, instead of only the observed groups
+    :type all_combinations: bool
+    :return: DataFrame with an 'X' column per attack followed by the outcome counts
+    :rtype: pd.DataFrame
+    """
+    attacks = sorted(set(attack for combo in groups for attack in combo))
+    counts = counts.reshape(-1, len(OUTCOME_COLUMNS))
+    if all_combinations:
+        max_len = max([len(combo) for combo in groups] + [0])
+        combos = [tuple(sorted(combo)) for combo in combinations_of_len(attacks, max_len)]
+        row_of = dict((combo, i) for i, combo in enumerate(groups))
+        combo_rows = np.array([row_of.get(combo, -1) for combo in combos], dtype=np.int64)
+        padded_counts = np.vstack([counts, np.zeros((1, len(OUTCOME_COLUMNS)), dtype=np.int64)])
+        combo_counts = padded_counts[combo_rows]
+    else:
+        observed = [i for i, combo in enumerate(groups) if combo]
+        combos = [groups[i] for i in observed]
+        combo_counts = counts[observed]
+
+    marks = np.where(attack_matrix(combos, attacks) == 1, 'X', ' ')
+    data = dict((col, marks[:, j]) for j, col in enumerate(fancy_titles(attacks)))
+    data.update((col, combo_counts[:, k]) for k, col in enumerate(OUTCOME_COLUMNS))
+    df = pd.DataFrame(data, columns=fancy_titles(attacks) + OUTCOME_COLUMNS)
+    return df.sort_values(OUTCOME_COLUMNS[0], ascending=False, kind='stable').reset_index(drop=True)
+
+
+class MetricsEvaluator(object):
+    def __init__(self):
+        """
+        Accumulates outcome counts per group of applied attacks over chunks of generated texts, so unbounded streams are
+        evaluated in memory proportional to the number of groups.
+        """
+        self.groups = []
+        self.counts = np.zeros((0, len(OUTCOME_COLUMNS)), dtype=np.int64)
+        self.num_texts = 0
+        self.num_original_positive = 0
+        self.num_generated_positive = 0
+        self._group_ids = {}
+
+    def update(self, texts_generated, original_preds, generated_preds):
+        """
+        Adds a chunk of generated texts and their predictions to the running counts.
+
+        :param texts_generated: Generated tuples (output of generate), only their attacks are used
+        :type texts_generated: Sequence[tuple]
+        :param original_preds: Label predicted for the original text of every generated text
+        :type original_preds: Sequence[int]
+        :param generated_preds: Label predicted for every generated text
+        :type generated_preds: Sequence[int]
+        """
+        self.update_counts(*group_outcome_counts(original_preds, generated_preds, [t_g[1] for t_g in texts_generated]))
+        self.num_texts += len(texts_generated)
+        self.num_original_positive += int(sum(original_preds))
+        self.num_generated_positive += int(sum(generated_preds))
+
+    def update_counts(self, groups, counts):
+        rows = []
+        for combo in groups:
+            group = self._group_ids.get(combo)
+            if group is None:
+                group = self._group_ids[combo] = len(self.groups)
+                self.groups.append(combo)
+            rows.append(group)
+        if len(self.groups) > len(self.counts):
+            self.counts = np.vstack([self.counts, np.zeros((len(self.groups) - len(self.counts), len(OUTCOME_COLUMNS)),
+                                                           dtype=np.int64)])
+        np.add.at(self.counts, rows, counts)
+
+    def misclassifications_single(self):
+        return misclassifications_single(self.groups, self.counts)
+
+    def misclassifications_group(self, all_combinations=False):
+        return misclassifications_group(self.groups, self.counts, all_combinations=all_combinations)
+
+    def state(self):
+        """
+        Returns the running counts as a JSON-serialisable dict, see from_state.
+        """
+        return {
+            'groups': [list(combo) for combo in self.groups],
+            'counts': self.counts.tolist(),
+            'num_texts': self.num_texts,
+            'num_original_positive': self.num_original_positive,
+            'num_generated_positive': self.num_generated_positive,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        evaluator = cls()
+        evaluator.update_counts([tuple(combo) for combo in state['groups']],
+                                np.asarray(state['counts'], dtype=np.int64).reshape(-1, len(OUTCOME_COLUMNS)))
+        evaluator.num_texts = state['num_texts']
+        evaluator.num_original_positive = state['num_original_positive']
+        evaluator.num_generated_positive = state['num_generated_positive']
+        return evaluator
+
+    def save(self, path):
+        """
+        Checkpoints the running counts to a JSON file, which load restores.
+        """
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self.state(), f)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_state(json.load(f))
@@ -0,0 +1,102 @@
+'''Columnar output of generated texts and metrics, written with pyarrow (an optional dependency)'''
+
+OUTPUT_FORMATS = {
+    'pickle': '.pkl',
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('Parquet and Arrow output require pyarrow, install it with: pip install pyarrow')
+    return pyarrow
+
+
+def generated_schema():
+    pa = _import_pyarrow()
+    return pa.schema([
+        ('attacked_text', pa.string()),
+        ('attacks', pa.list_(pa.string())),
+        ('original_index', pa.int64()),
+        ('iteration', pa.int32()),
+        ('seed', pa.uint64()),
+    ])
+
+
+class GeneratedTextWriter(object):
+    def __init__(self, path, format='parquet', row_group_size=100000):
+        """
+        Incrementally writes generated texts to a Parquet or Arrow IPC file with the columns attacked_text, attacks,
+        original_index, iteration and seed.
+
+        :param path: Path of the file to write
+        :type path: str
+        :param format: 'parquet' or 'arrow'
+        :type format: str
+        :param row_group_size: Number of rows buffered before they are written as one row group (or record batch)
+        :type row_group_size: int
+        """
+        if format not in ['parquet', 'arrow']:
+            raise ValueError('Unknown output format {!r}, expected parquet or arrow'.format(format))
+        pa = _import_pyarrow()
+        self.schema = generated_schema()
+        self.row_group_size = row_group_size
+        self.num_rows = 0
+        self._rows = []
+        if format == 'parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, self.schema)
+        else:
+            import pyarrow.ipc
+            self._writer = pa.ipc.new_file(path, self.schema)
+
+    def write(self, rows):
+        """
+        Buffers rows and writes every full row group.
+
+        :param rows: Tuples in format (attacked text, list of attacks, index of original text, iteration, seed), as
+            yielded by iter_generate(..., metadata=True)
+        :type rows: Iterable[tuple]
+        """
+        self._rows.extend(rows)
+        while len(self._rows) >= self.row_group_size:
+            self._write_rows(self._rows[:self.row_group_size])
+            self._rows = self._rows[self.row_group_size:]
+
+    def _write_rows(self, rows):
+        pa = _import_pyarrow()
+        columns = [list(column) for column in zip(*rows)]
+        batch = pa.RecordBatch.from_arrays([pa.array(column, type=field.type)
+                                            for column, field in zip(columns, self.schema)], schema=self.schema)
+        self._writer.write_table(pa.Table.from_batches([batch]))
+        self.num_rows += len(rows)
+
+    def close(self):
+        if self._rows:
+            self._write_rows(self._rows)
+            self._rows = []
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_dataframe(path, df, format='parquet'):
+    """
+    Writes a metrics DataFrame, including its index, to a Parquet or Arrow IPC file.
+    """
+    pa = _import_pyarrow()
+    table = pa.Table.from_pandas(df)
+    if format == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, path)
+    else:
+        import pyarrow.ipc
+        with pa.ipc.new_file(path, table.schema) as writer:
+            writer.write_table(table)
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+
+from Adversary.utils import bounded_map, iter_chunks
+
+'''Runs a model's predict function over many texts'''
+
+
+def predict_texts(texts, predict_function=None, batch_predict_function=None, batch_size=1000, max_concurrency=1,
+                  retries=0, on_retry=None):
+    """
+    Predicts the label of every text, either one text at a time or in batches.
+
+    Both predict functions may also be coroutine functions (async def), which are awaited on an event loop.
+
+    :param texts: Texts to predict
+    :type texts: list
+    :param predict_function: Function that maps a string to a classification label (0 or 1)
+    :type predict_function: Union[(str) -> int, None]
+    :param batch_predict_function: Function that maps a list of strings to a sequence of labels, used if given
+    :type batch_predict_function: Union[(list) -> Sequence[int], None]
+    :param batch_size: Maximum number of texts passed to a single batch_predict_function call
+    :type batch_size: int
+    :param max_concurrency: Maximum number of predict calls in flight at once, run on threads unless the function is async
+    :type max_concurrency: int
+    :param retries: Number of times a failing predict call is retried before its exception is raised
+    :type retries: int
+    :param on_retry: Hook called with (exception, attempt number, call argument) before each retry, e.g. to back off
+    :type on_retry: Union[(Exception, int, Union[str, list]) -> None, None]
+    :return: List of labels in the same order as texts
+    :rtype: list
+    """
+    if batch_predict_function is None:
+        if predict_function is None:
+            raise ValueError('Either predict_function or batch_predict_function must be given')
+        return run_calls(predict_function, texts, max_concurrency, retries, on_retry)
+
+    batches = list(iter_chunks(texts, batch_size))
+    preds = []
+    for batch, batch_preds in zip(batches, run_calls(batch_predict_function, batches, max_concurrency, retries, on_retry)):
+        batch_preds = list(batch_preds)
+        if len(batch_preds) != len(batch):
+            raise ValueError('batch_predict_function returned {} labels for {} texts'.format(len(batch_preds), len(batch)))
+        preds.extend(batch_preds)
+    return preds
+
+
+def predict_distinct(texts, predict):
+    """
+    Predicts every distinct text once and scatters the labels back to all of its occurrences.
+
+    :param texts: Texts to predict, possibly with repeats
+    :type texts: list
+    :param predict: Function that maps a list of distinct texts to a list of labels, e.g. a partial of predict_texts
+    :type predict: (list) -> list
+    :return: List of labels in the same order as texts, and the number of distinct texts that were predicted
+    :rtype: (list, int)
+    """
+    distinct = list(OrderedDict.fromkeys(texts))
+    preds_by_text = dict(zip(distinct, predict(distinct)))
+    return [preds_by_text[text] for text in texts], len(distinct)
+
+
+def run_calls(fn, args, max_concurrency=1, retries=0, on_retry=None):
+    """
+    Calls fn on every argument with at most max_concurrency calls in flight, returning results in order.
+    """
+    # asyncio and concurrent.futures are slow to import, so they are only loaded once predictions run
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    if asyncio.iscoroutinefunction(fn):
+        return _run_async_calls(fn, args, max_concurrency, retries, on_retry)
+
+    def call(arg):
+        attempt = 0
+        while True:
+            try:
+                return fn(arg)
+            except Exception as e:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                if on_retry is not None:
+                    on_retry(e, attempt, arg)
+
+    if max_concurrency <= 1:
+        return [call(arg) for arg in args]
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        return list(bounded_map(executor, call, args, 2 * max_concurrency))
+
+
+def _run_async_calls(fn, args, max_concurrency, retries, on_retry):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    async def call(arg):
+        attempt = 0
+        while True:
+            try:
+                return await fn(arg)
+            except Exception as e:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                if on_retry is not None:
+                    on_retry(e, attempt, arg)
+
+    async def run_all():
+        results = [None] * len(args)
+        remaining = iter(enumerate(args))
+
+        async def worker():
+            for i, arg in remaining:
+                results[i] = await call(arg)
+
+        await asyncio.gather(*[worker() for _ in range(max(1, max_concurrency))])
+        return results
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_all())
+    # an event loop is already running in this thread (e.g. in a notebook), so run on a fresh one in another thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_all()).result()
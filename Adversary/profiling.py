@@ -0,0 +1,115 @@
+import time
+from contextlib import nullcontext
+
+'''Opt-in timers and counters for the stages of generate and attack'''
+
+# shared by every disabled stage, so disabled profiling costs one None check per stage
+NO_PROFILING = nullcontext()
+
+
+def profile_stage(profiler, name, items=0):
+    return NO_PROFILING if profiler is None else profiler.stage(name, items)
+
+
+class Profiler(object):
+    def __init__(self, callbacks=None):
+        """
+        Keeps cumulative seconds and item counts per stage, and calls, no-ops (results equal to their input) and seconds
+        per attack.
+
+        :param callbacks: Functions called with the profile of every finished shard, or of every attack call, in the
+            format of results
+        :type callbacks: Union[list, None]
+        """
+        self.callbacks = list(callbacks or [])
+        self.stages = {}
+        self.attacks = {}
+
+    def __getstate__(self):
+        # callbacks run in the process that owns the profiler, workers only send their counts back
+        state = self.__dict__.copy()
+        state['callbacks'] = []
+        return state
+
+    def stage(self, name, items=0):
+        """
+        Returns a context manager that adds the time spent in it, and items, to the named stage.
+        """
+        return _StageTimer(self, name, items)
+
+    def add_stage(self, name, seconds, items=0):
+        totals = self.stages.setdefault(name, [0., 0, 0])
+        totals[0] += seconds
+        totals[1] += 1
+        totals[2] += items
+
+    def add_attack(self, name, inputs, outputs, seconds):
+        totals = self.attacks.setdefault(name, [0, 0, 0.])
+        totals[0] += len(inputs)
+        totals[1] += sum(1 for i, o in zip(inputs, outputs) if i == o)
+        totals[2] += seconds
+
+    def merge(self, other):
+        """
+        Adds the counts of another profiler, or of its results, to this one.
+        """
+        results = other.results() if isinstance(other, Profiler) else other
+        for name, stage in results['stages'].items():
+            totals = self.stages.setdefault(name, [0., 0, 0])
+            totals[0] += stage['seconds']
+            totals[1] += stage['calls']
+            totals[2] += stage['items']
+        for name, attack in results['attacks'].items():
+            totals = self.attacks.setdefault(name, [0, 0, 0.])
+            totals[0] += attack['calls']
+            totals[1] += attack['noops']
+            totals[2] += attack['seconds']
+
+    def notify(self, results):
+        for callback in self.callbacks:
+            callback(results)
+
+    def results(self):
+        """
+        :return: Dict with a 'stages' dict of stage name to seconds, calls and items, and an 'attacks' dict of attack name
+            to calls (texts or words attacked), noops, noop_rate and seconds
+        :rtype: dict
+        """
+        return {
+            'stages': dict((name, {'seconds': seconds, 'calls': calls, 'items': items})
+                           for name, (seconds, calls, items) in self.stages.items()),
+            'attacks': dict((name, {'calls': calls, 'noops': noops, 'noop_rate': 1. * noops / calls if calls else 0.,
+                                    'seconds': seconds})
+                            for name, (calls, noops, seconds) in self.attacks.items()),
+        }
+
+    def to_dataframes(self):
+        """
+        :return: DataFrames of the stage and attack results, indexed by name
+        :rtype: (pd.DataFrame, pd.DataFrame)
+        """
+        import pandas as pd
+        results = self.results()
+        return (pd.DataFrame.from_dict(results['stages'], orient='index', columns=['seconds', 'calls', 'items']),
+                pd.DataFrame.from_dict(results['attacks'], orient='index',
+                                       columns=['calls', 'noops', 'noop_rate', 'seconds']))
+
+    def reset(self):
+        self.stages = {}
+        self.attacks = {}
+
+
+class _StageTimer(object):
+    __slots__ = ['profiler', 'name', 'items', 'start']
+
+    def __init__(self, profiler, name, items):
+        self.profiler = profiler
+        self.name = name
+        self.items = items
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.add_stage(self.name, time.perf_counter() - self.start, self.items)
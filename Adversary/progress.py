@@ -0,0 +1,117 @@
+import logging
+import time
+from datetime import timedelta
+
+'''Progress reports of generate and attack, throttled by time and sent to pluggable sinks'''
+
+
+def format_progress(event):
+    """
+    Formats a progress event as a single line, e.g. 'generate: 3000/6000 texts (50.0%), 1200.0 texts/s, ETA 0:00:02'.
+    """
+    if event['total']:
+        done = '{}/{} {} ({:.1f}%)'.format(event['done'], event['total'], event['unit'],
+                                           100. * event['done'] / event['total'])
+    else:
+        done = '{} {}'.format(event['done'], event['unit'])
+    parts = ['{}: {}'.format(event['task'], done), '{:.1f} {}/s'.format(event['rate'], event['unit'])]
+    if event['final']:
+        parts.append('took {}'.format(timedelta(seconds=int(round(event['elapsed'])))))
+    elif event['eta'] is not None:
+        parts.append('ETA {}'.format(timedelta(seconds=int(round(event['eta'])))))
+    parts.extend('{} {}'.format(key.replace('_', ' '), value) for key, value in sorted(event['info'].items()))
+    return ', '.join(parts)
+
+
+def print_sink(event):
+    print(format_progress(event))
+
+
+class LoggingSink(object):
+    def __init__(self, logger=None, level=logging.INFO):
+        """
+        Sink that logs every progress event as a formatted line, with the event itself as the record's 'progress' extra.
+
+        :param logger: Logger to write to -- the 'Adversary' logger if None
+        :type logger: Union[logging.Logger, None]
+        :param level: Level of the log records
+        :type level: int
+        """
+        self.logger = logging.getLogger('Adversary') if logger is None else logger
+        self.level = level
+
+    def __call__(self, event):
+        self.logger.log(self.level, format_progress(event), extra={'progress': event})
+
+
+class ProgressReporter(object):
+    def __init__(self, sinks=None, interval=1.0):
+        """
+        Sends progress events to sinks at most once per interval, plus a final event when a task finishes.
+
+        Events are dicts with the keys task, unit, done, total (None if unknown), elapsed (seconds), rate (units per
+        second), eta (seconds, None if the total is unknown), final and info (dict of task-specific values).
+
+        :param sinks: Functions called with every event, e.g. print_sink, a LoggingSink or any callback
+        :type sinks: Union[list, None]
+        :param interval: Minimum number of seconds between two events of a task
+        :type interval: float
+        """
+        self.sinks = list(sinks or [])
+        self.interval = interval
+
+    def task(self, name, total=None, unit='texts'):
+        """
+        Starts reporting on a task.
+
+        :param name: Name of the task, e.g. 'generate'
+        :type name: str
+        :param total: Number of units the task will process, if known
+        :type total: Union[int, None]
+        :param unit: Name of the units
+        :type unit: str
+        :rtype: ProgressTask
+        """
+        return ProgressTask(self, name, total, unit)
+
+    def emit(self, event):
+        for sink in self.sinks:
+            sink(event)
+
+
+class ProgressTask(object):
+    def __init__(self, reporter, name, total, unit):
+        self.reporter = reporter
+        self.name = name
+        self.total = total
+        self.unit = unit
+        self.done = 0
+        self.start = self.last_report = time.monotonic()
+
+    def update(self, n, **info):
+        """
+        Adds n finished units, and reports them if the reporter's interval has passed since the last report.
+        """
+        self.done += n
+        if not self.reporter.sinks:
+            return
+        now = time.monotonic()
+        if now - self.last_report >= self.reporter.interval:
+            self.last_report = now
+            self.reporter.emit(self._event(now, False, info))
+
+    def finish(self, **info):
+        """
+        Reports the task as finished, with optional task-specific values such as accuracies.
+        """
+        if self.reporter.sinks:
+            self.reporter.emit(self._event(time.monotonic(), True, info))
+
+    def _event(self, now, final, info):
+        elapsed = now - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(self.total - self.done, 0) / rate
+        return {'task': self.name, 'unit': self.unit, 'done': self.done, 'total': self.total, 'elapsed': elapsed,
+                'rate': rate, 'eta': eta, 'final': final, 'info': info}
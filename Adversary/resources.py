@@ -0,0 +1,130 @@
+import mmap
+import struct
+import sys
+from collections.abc import Mapping
+
+'''Compact, memory-mapped storage for the word lists used by attacks
+
+A string table file holds every distinct string once, plus lists of indices into those strings:
+
+    magic (8 bytes), then little-endian uint32 values:
+    number of strings, number of lists, number of list items, byte length of the string blob
+    string offsets (number of strings + 1), list offsets (number of lists + 1), list items
+    UTF-8 string blob
+'''
+
+MAGIC = b'ADVSTR01'
+HEADER = struct.Struct('<4I')
+
+
+def write_string_table(path, lists):
+    """
+    Writes lists of strings to a string table file, storing every distinct string once.
+
+    :param path: Path of the file to write
+    :type path: str
+    :param lists: Lists of strings
+    :type lists: list
+    """
+    string_ids = {}
+    encoded = []
+    for strings in lists:
+        for s in strings:
+            if s not in string_ids:
+                string_ids[s] = len(encoded)
+                encoded.append(s.encode('utf-8'))
+
+    string_offsets = [0]
+    for e in encoded:
+        string_offsets.append(string_offsets[-1] + len(e))
+    list_offsets = [0]
+    for strings in lists:
+        list_offsets.append(list_offsets[-1] + len(strings))
+    list_items = [string_ids[s] for strings in lists for s in strings]
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(HEADER.pack(len(encoded), len(lists), len(list_items), string_offsets[-1]))
+        for values in [string_offsets, list_offsets, list_items]:
+            f.write(struct.pack('<{}I'.format(len(values)), *values))
+        f.write(b''.join(encoded))
+
+
+class StringTable(object):
+    def __init__(self, path):
+        """
+        Memory-maps a string table file, decoding strings only when they are first read.
+
+        :param path: Path of a file written by write_string_table
+        :type path: str
+        """
+        with open(path, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError('{} is not a string table file'.format(path))
+        num_strings, num_lists, num_items, _ = HEADER.unpack_from(self._buffer, len(MAGIC))
+
+        start = len(MAGIC) + HEADER.size
+        self._string_offsets = self._uint32_array(start, num_strings + 1)
+        start += 4 * (num_strings + 1)
+        self._list_offsets = self._uint32_array(start, num_lists + 1)
+        start += 4 * (num_lists + 1)
+        self._list_items = self._uint32_array(start, num_items)
+        self._blob_start = start + 4 * num_items
+        self._strings = [None] * num_strings
+
+    def _uint32_array(self, start, length):
+        view = memoryview(self._buffer)[start:start + 4 * length]
+        if sys.byteorder == 'little':
+            return view.cast('I')
+        return struct.unpack('<{}I'.format(length), view)
+
+    def __len__(self):
+        return len(self._list_offsets) - 1
+
+    def string(self, i):
+        s = self._strings[i]
+        if s is None:
+            start = self._blob_start + self._string_offsets[i]
+            end = self._blob_start + self._string_offsets[i + 1]
+            s = self._strings[i] = sys.intern(self._buffer[start:end].decode('utf-8'))
+        return s
+
+    def first(self, i):
+        return self.string(self._list_items[self._list_offsets[i]])
+
+    def list(self, i):
+        return [self.string(j) for j in self._list_items[self._list_offsets[i]:self._list_offsets[i + 1]]]
+
+
+class StringListMap(Mapping):
+    def __init__(self, table):
+        """
+        Read-only mapping over a string table whose lists each start with their key, followed by the values.
+
+        :param table: String table to read from
+        :type table: StringTable
+        """
+        self._table = table
+        self._index = None
+        self._values = {}
+
+    def _key_index(self):
+        if self._index is None:
+            self._index = dict((self._table.first(i), i) for i in range(len(self._table)))
+        return self._index
+
+    def __getitem__(self, key):
+        values = self._values.get(key)
+        if values is None:
+            values = self._values[key] = self._table.list(self._key_index()[key])[1:]
+        return values
+
+    def __contains__(self, key):
+        return key in self._key_index()
+
+    def __iter__(self):
+        return iter(self._key_index())
+
+    def __len__(self):
+        return len(self._table)
@@ -0,0 +1,55 @@
+from random import Random
+
+'''Bernoulli samplers that decide which texts, attacks and words are attacked'''
+
+
+class PythonSampler(object):
+    def __init__(self, random_seed):
+        """
+        Draws every decision with a separate call to a random.Random generator, which attacks also draw from.
+
+        :param random_seed: Seed of the generator
+        :type random_seed: int
+        """
+        self.rng = Random(random_seed)
+        self.attack_rng = self.rng
+
+    def bernoulli(self, n, p):
+        """
+        Draws n independent decisions that are each True with probability p.
+        """
+        draw = self.rng.random
+        return [p >= draw() for _ in range(n)]
+
+    def bernoulli_matrix(self, n, ps):
+        """
+        Draws n rows of decisions, where the decision in column k is True with probability ps[k].
+        """
+        draw = self.rng.random
+        return [[p >= draw() for p in ps] for _ in range(n)]
+
+
+class NumpySampler(object):
+    def __init__(self, random_seed):
+        """
+        Draws whole batches of decisions with single vectorised calls to a numpy.random.Generator, attacks draw from a
+        random.Random generator with the same seed.
+
+        :param random_seed: Seed of the generators
+        :type random_seed: int
+        """
+        import numpy as np
+        self.rng = np.random.default_rng(random_seed)
+        self.attack_rng = Random(random_seed)
+
+    def bernoulli(self, n, p):
+        return (self.rng.random(n) <= p).tolist()
+
+    def bernoulli_matrix(self, n, ps):
+        return (self.rng.random((n, len(ps))) <= ps).tolist()
+
+
+SAMPLERS = {
+    'python': PythonSampler,
+    'numpy': NumpySampler,
+}
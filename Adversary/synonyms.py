@@ -0,0 +1,244 @@
+from collections import OrderedDict
+from itertools import chain
+from string import punctuation
+
+from Adversary.constants import load_neutral_words, load_synonyms
+from Adversary.resources import StringListMap, StringTable, write_string_table
+
+'''Synonym lookup that matches inflected, capitalised and punctuated forms of the synonym keys'''
+
+VOWELS = 'aeiou'
+SUFFIXES = ('s', 'ed', 'ing')
+# inflected forms are only indexed for stems this long, so short words such as 'is' and 'wed' do not hit 'i' and 'we'
+MIN_STEM_LENGTH = 3
+# pronouns, determiners, prepositions, conjunctions and auxiliaries, which are not inflected like content words
+CLOSED_CLASS_WORDS = frozenset([
+    'a', 'an', 'the', 'this', 'that', 'these', 'those', 'some', 'any', 'all', 'each', 'every', 'no', 'both', 'either',
+    'neither', 'much', 'many', 'more', 'most', 'few', 'less', 'other', 'such', 'own', 'same',
+    'i', 'me', 'my', 'mine', 'we', 'us', 'our', 'ours', 'you', 'your', 'yours', 'he', 'him', 'his', 'she', 'her', 'hers',
+    'it', 'its', 'they', 'them', 'their', 'theirs', 'who', 'whom', 'whose', 'what', 'which', 'one', 'ones',
+    'about', 'above', 'across', 'after', 'against', 'along', 'among', 'around', 'as', 'at', 'before', 'behind',
+    'below', 'beneath', 'beside', 'between', 'beyond', 'by', 'down', 'during', 'except', 'for', 'from', 'in',
+    'inside', 'into', 'near', 'of', 'off', 'on', 'onto', 'out', 'outside', 'over', 'past', 'since', 'through',
+    'till', 'to', 'toward', 'towards', 'under', 'until', 'up', 'upon', 'with', 'within', 'without',
+    'and', 'but', 'or', 'nor', 'so', 'yet', 'if', 'then', 'than', 'because', 'although', 'though', 'while', 'when',
+    'where', 'whether', 'how', 'why', 'not',
+    'be', 'am', 'is', 'are', 'was', 'were', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'done',
+    'can', 'could', 'may', 'might', 'must', 'shall', 'should', 'will', 'would', 'ought',
+    'here', 'there', 'now', 'just', 'very', 'too', 'also', 'only',
+])
+
+
+def inflect(word, suffix):
+    """
+    Appends an inflection suffix ('s', 'ed' or 'ing') to a base word, following basic English spelling rules.
+    """
+    if not suffix or not word:
+        return word
+    if suffix == 's':
+        if word.endswith(('s', 'x', 'z', 'ch', 'sh')):
+            return word + 'es'
+        if len(word) > 1 and word[-1] == 'y' and word[-2] not in VOWELS:
+            return word[:-1] + 'ies'
+        return word + 's'
+    if suffix == 'ed':
+        if word.endswith('e'):
+            return word + 'd'
+        if len(word) > 1 and word[-1] == 'y' and word[-2] not in VOWELS:
+            return word[:-1] + 'ied'
+        return word + 'ed'
+    if suffix == 'ing':
+        if word.endswith('e') and not word.endswith('ee'):
+            return word[:-1] + 'ing'
+        return word + 'ing'
+    return word + suffix
+
+
+def uninflect(word):
+    """
+    Removes a regular inflection suffix ('s', 'ed' or 'ing') from a word, the inverse of inflect as far as spelling
+    allows. Words that would keep fewer than MIN_STEM_LENGTH letters are returned unchanged.
+    """
+    lowered = word.lower()
+    if lowered.endswith(('ies', 'ied')) and len(word) - 3 >= MIN_STEM_LENGTH - 1:
+        return word[:-3] + ('Y' if word[-1].isupper() else 'y')
+    if lowered.endswith(('sses', 'xes', 'zes', 'ches', 'shes')) and len(word) - 2 >= MIN_STEM_LENGTH:
+        return word[:-2]
+    if lowered.endswith('s') and not lowered.endswith(('ss', 'us', 'is')) and len(word) - 1 >= MIN_STEM_LENGTH:
+        return word[:-1]
+    if lowered.endswith('ed') and len(word) - 2 >= MIN_STEM_LENGTH:
+        return word[:-2]
+    if lowered.endswith('ing') and len(word) - 3 >= MIN_STEM_LENGTH:
+        return word[:-3]
+    return word
+
+
+def match_case(word, template):
+    if len(template) > 1 and template.isupper():
+        return word.upper()
+    if template[:1].isupper():
+        return word[:1].upper() + word[1:]
+    return word
+
+
+class SynonymIndex(object):
+    def __init__(self, synonyms=None, forms=None, known_words=None):
+        """
+        Index from normalised word forms (lowercased, optionally inflected with 's', 'ed' or 'ing') to synonym keys.
+
+        :param synonyms: Mapping of word to list of synonyms -- the built-in synonyms if None
+        :type synonyms: Union[Mapping[str, list], None]
+        :param forms: Precomputed mapping of form to (key, suffix) -- built from synonyms if None
+        :type forms: Union[Mapping[str, list], None]
+        :param known_words: Words that synonyms may be inflected into -- the synonym keys and lists, and the neutral
+            words if None
+        :type known_words: Union[Iterable[str], None]
+        """
+        self.synonyms = load_synonyms() if synonyms is None else synonyms
+        self.forms = self._build_forms() if forms is None else forms
+        if known_words is None and forms is None:
+            known_words = chain(self.synonyms, chain.from_iterable(self.synonyms.values()), load_neutral_words())
+        self.known_words = frozenset(word.lower() for word in known_words or [])
+        self.path = None
+        self._inflected = {}
+
+    def __reduce__(self):
+        # indexes loaded from a file are re-mapped rather than copied into other processes
+        if self.path is not None:
+            return SynonymIndex.load, (self.path,)
+        return SynonymIndex, (dict(self.synonyms), self.forms, self.known_words)
+
+    def _build_forms(self):
+        keys = dict((key.lower(), key) for key in self.synonyms)
+        stems_of = {}
+        for suffix in SUFFIXES:
+            for lowered, key in keys.items():
+                if len(lowered) < MIN_STEM_LENGTH or lowered in CLOSED_CLASS_WORDS:
+                    continue
+                form = inflect(lowered, suffix)
+                if form not in keys and form not in CLOSED_CLASS_WORDS:
+                    stems_of.setdefault(form, []).append((lowered, key, suffix))
+        forms = dict((lowered, (key, '')) for lowered, key in keys.items())
+        for form, stems in stems_of.items():
+            # forms of several stems, such as 'cared' of 'car' and 'care', go to the longest (e-final) stem, and are
+            # dropped if that is still ambiguous
+            longest = max(len(lowered) for lowered, _, _ in stems)
+            stems = [(key, suffix) for lowered, key, suffix in stems if len(lowered) == longest]
+            if len(stems) == 1:
+                forms[form] = stems[0]
+        return forms
+
+    def stem(self, word):
+        """
+        Returns the base form of a word, from the index if it is an inflected form of a synonym key, else by spelling.
+        """
+        entry = self.forms.get(word.lower())
+        if entry is not None:
+            key, suffix = entry
+            return key if suffix else word
+        return uninflect(word)
+
+    def synonyms_of(self, form):
+        """
+        Returns the synonyms of a lowercased word form in the same inflection.
+
+        Synonyms are only inflected into known words (or the form itself), synonyms that already carry the form's
+        suffix are kept as they are, and any other synonym is left out.
+
+        :param form: Lowercased word form
+        :type form: str
+        :return: List of synonyms, or None if the form has none
+        :rtype: Union[list, None]
+        """
+        entry = self.forms.get(form)
+        if entry is None:
+            return None
+        key, suffix = entry
+        if not suffix:
+            return list(self.synonyms[key]) or None
+        inflected = self._inflected.get(form)
+        if inflected is None:
+            inflected = []
+            for synonym in self.synonyms[key]:
+                word = inflect(self.stem(synonym), suffix)
+                if word == synonym or word.lower() == form or word.lower() in self.known_words:
+                    inflected.append(word)
+            inflected = self._inflected[form] = list(OrderedDict.fromkeys(inflected))
+        return inflected or None
+
+    def candidates(self, word):
+        """
+        Returns the distinct synonyms of a word in the word's inflection, casing and surrounding punctuation.
+
+        :param word: Word as it appears in a text
+        :type word: str
+        :return: List of replacements, or None if the word has no synonyms
+        :rtype: Union[list, None]
+        """
+        stripped = word.strip(punctuation)
+        if not stripped:
+            return None
+        synonyms = self.synonyms_of(stripped.lower())
+        if synonyms is None:
+            return None
+        start = word.index(stripped)
+        prefix, postfix = word[:start], word[start + len(stripped):]
+        return list(OrderedDict.fromkeys(prefix + match_case(synonym, stripped) + postfix for synonym in synonyms))
+
+    def save(self, path):
+        """
+        Writes the index to a string table file, which load memory-maps so processes share its pages. Every form is
+        saved with its synonyms already inflected, so loaded indexes need neither the keys nor the known words.
+        """
+        rows = []
+        for form in self.forms:
+            synonyms = self.synonyms_of(form)
+            if synonyms is not None:
+                rows.append([form] + synonyms)
+        write_string_table(path, rows)
+
+    @classmethod
+    def load(cls, path):
+        entries = StringListMap(StringTable(path))
+        index = cls(synonyms=entries, forms=_SavedForms(entries))
+        index.path = path
+        return index
+
+
+_synonym_index = None
+
+
+def set_synonym_index(index=None):
+    """
+    Replaces the index used by the synonym attack.
+
+    :param index: Index, or path of a file written by SynonymIndex.save -- an index of the built-in synonyms if None
+    :type index: Union[SynonymIndex, str, None]
+    :return: The index now in use
+    :rtype: SynonymIndex
+    """
+    global _synonym_index
+    if index is None:
+        index = SynonymIndex()
+    elif isinstance(index, str):
+        index = SynonymIndex.load(index)
+    _synonym_index = index
+    return _synonym_index
+
+
+def synonym_index():
+    if _synonym_index is None:
+        return set_synonym_index()
+    return _synonym_index
+
+
+class _SavedForms(object):
+    # saved forms are their own keys, their synonyms are stored in the form's inflection
+    def __init__(self, entries):
+        self._entries = entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def get(self, form, default=None):
+        return (form, '') if form in self._entries else default
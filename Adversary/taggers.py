@@ -0,0 +1,198 @@
+import re
+
+from Adversary.constants import load_neutral_words, load_synonyms
+
+'''Tokenizer and part-of-speech taggers used to pick the words that word-level attacks act on'''
+
+# numbers with separators, words with inner apostrophes or hyphens, or single punctuation characters
+TOKEN_PATTERN = re.compile(r"\d+(?:[.,]\d+)+|\w+(?:['\u2019-]\w+)*|[^\w\s]")
+
+
+def tokenize(text):
+    """
+    Splits a text into word and punctuation tokens in a single pass.
+
+    :param text: Text to tokenize
+    :type text: str
+    :return: List of (token, start offset, end offset) tuples, where text[start:end] == token
+    :rtype: list
+    """
+    return [(m.group(), m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+
+
+def align_tags(tokens, tagged):
+    """
+    Matches every (word, tag) tuple to the next token equal to its word, tokens without a match are tagged None.
+    """
+    tags = [None] * len(tokens)
+    i = 0
+    for word, tag in tagged:
+        for j in range(i, len(tokens)):
+            if tokens[j] == word:
+                tags[j] = tag
+                i = j + 1
+                break
+    return tags
+
+
+class Tagger(object):
+    # subclasses implement tag_tokens, or tag if they tokenize texts themselves
+    def tag(self, text):
+        """
+        Tags a single text.
+
+        :param text: Text to tag
+        :type text: str
+        :return: List of (word, Penn Treebank tag) tuples
+        :rtype: list
+        """
+        tokens = [token for token, _, _ in tokenize(text)]
+        return list(zip(tokens, self.tag_tokens(tokens)))
+
+    def tag_batch(self, texts):
+        """
+        Tags many texts at once.
+
+        :param texts: Texts to tag
+        :type texts: list
+        :return: List with one list of (word, Penn Treebank tag) tuples per text
+        :rtype: list
+        """
+        return [self.tag(text) for text in texts]
+
+    def tag_tokens(self, tokens):
+        """
+        Tags the tokens of a text, as returned by tokenize.
+
+        By default the tokens are joined with spaces and tagged with tag, and every tag is matched to the next token
+        equal to its word, so tokens the tagger splits or drops differently are tagged None instead of shifting the
+        tags of the tokens after them.
+
+        :param tokens: Tokens to tag
+        :type tokens: list
+        :return: List with one Penn Treebank tag (or None) per token
+        :rtype: list
+        """
+        return align_tags(tokens, self.tag(' '.join(tokens)))
+
+    def tag_tokens_batch(self, tokenized):
+        """
+        Tags the tokens of many texts at once.
+
+        :param tokenized: List with one list of tokens per text
+        :type tokenized: list
+        :return: List with one list of tags per text
+        :rtype: list
+        """
+        return [self.tag_tokens(tokens) for tokens in tokenized]
+
+
+class TextBlobTagger(Tagger):
+    def tag_tokens(self, tokens):
+        # TextBlob's default tagger, NLTKTagger, runs NLTK's averaged perceptron over the blob's tokens -- given the
+        # tokens directly, its tags line up with them. NLTK is only imported once texts are actually tagged
+        from nltk import pos_tag
+        return [tag for _, tag in pos_tag(tokens)]
+
+    def tag_tokens_batch(self, tokenized):
+        from nltk import pos_tag_sents
+        return [[tag for _, tag in tagged] for tagged in pos_tag_sents(tokenized)]
+
+
+CLOSED_CLASS_TAGS = {
+    'DT': 'a an the this that these those all any every no some each either neither',
+    'IN': 'about across after against among at before between by down from in into off on onto over through '
+          'to under up upon with within without as for of till until than since during via',
+    'PRP': 'i me my mine you your yours he him his she her hers it its we us our ours they them their theirs '
+           'myself yourself himself herself itself ourselves themselves',
+    'CC': 'and but or nor yet',
+    'WP': 'who whom whose which what',
+    'WRB': 'how when where why while',
+    'MD': 'may will can could would should must shall might',
+    'RB': 'not very quite only even still again ever far now then there here almost enough too also just so',
+    'UH': 'please yes',
+}
+
+SUFFIX_TAGS = [
+    ('ly', 'RB'),
+    ('ing', 'VBG'),
+    ('ed', 'VBD'),
+    ('tion', 'NN'),
+    ('ness', 'NN'),
+    ('ment', 'NN'),
+    ('ity', 'NN'),
+    ('ous', 'JJ'),
+    ('ful', 'JJ'),
+    ('ive', 'JJ'),
+    ('able', 'JJ'),
+    ('ible', 'JJ'),
+    ('less', 'JJ'),
+    ('al', 'JJ'),
+    ('ic', 'JJ'),
+    ('s', 'NNS'),
+]
+
+NUMBER_PATTERN = re.compile(r'^[+-]?\d[\d,.]*$')
+STRIP_CHARS = '\'"`.,;:!?()[]{}<>*-'
+
+
+def suffix_tag(word):
+    for suffix, tag in SUFFIX_TAGS:
+        if word.endswith(suffix) and len(word) > len(suffix) + 2:
+            return tag
+    return None
+
+
+def build_lexicon():
+    lexicon = {}
+    synonyms = load_synonyms()
+    for word in load_neutral_words() + list(synonyms.keys()) + [w for ws in synonyms.values() for w in ws]:
+        word = word.lower()
+        lexicon[word] = suffix_tag(word) or 'NN'
+    for tag, words in CLOSED_CLASS_TAGS.items():
+        for word in words.split():
+            lexicon[word] = tag
+    return lexicon
+
+
+class LexiconTagger(Tagger):
+    def __init__(self, lexicon=None):
+        """
+        Coarse tagger that looks words up in a lexicon and falls back to suffix heuristics.
+
+        Tokens are tagged one by one, so tags always line up with the tokens that word-level attacks rewrite.
+
+        :param lexicon: Mapping of lowercased word to Penn Treebank tag -- built from the attack vocabularies if None
+        :type lexicon: Union[dict, None]
+        """
+        self.lexicon = build_lexicon() if lexicon is None else lexicon
+
+    def tag_word(self, word):
+        stripped = word.strip(STRIP_CHARS)
+        if not stripped:
+            return 'SYM'
+        if NUMBER_PATTERN.match(stripped):
+            return 'CD'
+        lowered = stripped.lower()
+        tag = self.lexicon.get(lowered)
+        if tag is not None:
+            return tag
+        tag = suffix_tag(lowered)
+        if tag is not None:
+            return tag
+        return 'NNP' if stripped[0].isupper() else 'NN'
+
+    def tag_tokens(self, tokens):
+        return [self.tag_word(token) for token in tokens]
+
+    def tag_tokens_batch(self, tokenized):
+        word_tags = {}
+        for tokens in tokenized:
+            for token in tokens:
+                if token not in word_tags:
+                    word_tags[token] = self.tag_word(token)
+        return [[word_tags[token] for token in tokens] for tokens in tokenized]
+
+    def tag_batch(self, texts):
+        tokenized = [[token for token, _, _ in tokenize(text)] for text in texts]
+        return [list(zip(tokens, tags)) for tokens, tags in zip(tokenized, self.tag_tokens_batch(tokenized))]
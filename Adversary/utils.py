@@ -1,5 +1,8 @@
+import hashlib
 import pickle
-from itertools import chain, combinations
+import threading
+from collections import OrderedDict, deque
+from itertools import chain, combinations, islice
 
 
 def polite_printer(s, verbose=False):
@@ -27,3 +30,89 @@ def combinations_of_len(l, k):
 
 def fancy_titles(cols):
     return [' '.join([c_w.title() for c_w in c.split('_')]) for c in cols]
+
+
+def iter_chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bounded_map(executor, fn, iterable, max_in_flight):
+    """
+    Like Executor.map, but only submits new work once fewer than max_in_flight results are pending.
+    """
+    pending = deque()
+    for item in iterable:
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def derive_seed(random_seed, index):
+    digest = hashlib.sha256('{}:{}'.format(random_seed, index).encode('utf-8')).hexdigest()
+    return int(digest[:16], 16)
+
+
+class LRUCache(object):
+    def __init__(self, maxsize=128):
+        """
+        Least-recently-used mapping with hit and miss counters.
+
+        :param maxsize: Maximum number of entries kept -- None for unbounded, 0 to disable caching
+        :type maxsize: Union[int, None]
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
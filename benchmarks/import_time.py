@@ -0,0 +1,53 @@
+"""
+Measures how long importing Adversary modules takes in a fresh interpreter.
+
+Usage: python benchmarks/import_time.py [--runs 10] [--budget-ms 150]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ['Adversary.attacks', 'Adversary']
+HEAVY_MODULES = ['numpy', 'pandas', 'textblob', 'nltk']
+
+SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000)
+print(','.join(m for m in {heavy!r} if m in sys.modules))
+'''
+
+
+def measure(module, runs):
+    times = []
+    heavy = ''
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, '-c', SCRIPT.format(module=module, heavy=HEAVY_MODULES)],
+                                      cwd=REPO_DIR, universal_newlines=True).splitlines()
+        times.append(float(out[0]))
+        heavy = out[1] if len(out) > 1 else ''
+    times.sort()
+    return {'module': module, 'median_ms': times[len(times) // 2], 'min_ms': times[0],
+            'heavy_modules': [m for m in heavy.split(',') if m]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=None, help='Exit with an error if a median exceeds this')
+    args = parser.parse_args()
+
+    results = [measure(module, args.runs) for module in MODULES]
+    print(json.dumps(results, indent=2))
+    over_budget = [r for r in results if r['heavy_modules'] or (args.budget_ms is not None and r['median_ms'] > args.budget_ms)]
+    if over_budget:
+        sys.exit('Import budget exceeded by: {}'.format(', '.join(r['module'] for r in over_budget)))
+
+
+if __name__ == '__main__':
+    main()
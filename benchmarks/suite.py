@@ -0,0 +1,166 @@
+"""
+Times generate, every attack, tagging and the attack metrics on synthetic corpora with fixed seeds.
+
+Usage: python benchmarks/suite.py [--texts 1000] [--words 20] [--repeat 3] [--only generate] [--output results.json]
+                                  [--compare baseline.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from Adversary import Adversary  # noqa: E402
+from Adversary.attacks import ATTACK_MAP, BATCH_ATTACK_MAP  # noqa: E402
+from Adversary.constants import load_neutral_words, load_synonyms  # noqa: E402
+from Adversary.taggers import LexiconTagger, TextBlobTagger, tokenize  # noqa: E402
+
+GENERATE_CONFIGS = {
+    'all': 'all',
+    'text': lambda: list(ATTACK_MAP['text']),
+    'word': lambda: list(ATTACK_MAP['word']),
+}
+TAGGERS = {'textblob': TextBlobTagger, 'lexicon': LexiconTagger}
+
+
+def make_corpus(num_texts, num_words, random_seed=0):
+    """
+    Builds texts from the attack vocabularies, numbers and punctuation, so every attack has words to act on.
+    """
+    rng = random.Random(random_seed)
+    vocabulary = sorted(load_synonyms()) + load_neutral_words()[:2000] + [str(i) for i in range(10)]
+    texts = []
+    for _ in range(num_texts):
+        words = [rng.choice(vocabulary) for _ in range(num_words)]
+        for i in rng.sample(range(num_words), max(1, num_words // 8)):
+            words[i] += rng.choice(',.!?')
+        texts.append(' '.join(words))
+    return texts
+
+
+def measure(name, function, num_items, repeat):
+    """
+    Runs function once untimed, so lazy imports and data loads are not timed, then repeat times for its best time, and
+    once more under tracemalloc for its peak memory.
+    """
+    function()
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best = min(seconds)
+    return {'name': name, 'items': num_items, 'best_s': best, 'median_s': sorted(seconds)[len(seconds) // 2],
+            'items_per_s': num_items / best if best > 0 else None, 'peak_kb': peak // 1024}
+
+
+def benchmarks(texts, args):
+    words = [token for text in texts for token, _, _ in tokenize(text) if token[0].isalnum()]
+
+    # the tag cache is disabled so repeated runs do not get faster by reusing the tags of the first
+    generator = Adversary(tagger=TAGGERS[args.tagger](), tag_cache_size=0)
+    for config_name, config in sorted(GENERATE_CONFIGS.items()):
+        attacks = config() if callable(config) else config
+        yield 'generate/{}'.format(config_name), len(texts), \
+            lambda attacks=attacks: generator.generate(texts, attacks=attacks, random_seed=args.seed,
+                                                       shard_size=args.shard_size, sampling=args.sampling)
+
+    for kind, items in [('text', texts), ('word', words)]:
+        for attack_name, attack in sorted(ATTACK_MAP[kind].items()):
+            yield 'attack/{}'.format(attack_name), len(items), \
+                lambda attack=attack, items=items: [attack(item, random.Random(args.seed)) for item in items]
+            if attack_name in BATCH_ATTACK_MAP:
+                yield 'attack_batch/{}'.format(attack_name), len(items), \
+                    lambda batch=BATCH_ATTACK_MAP[attack_name], items=items: batch(items, random.Random(args.seed))
+
+    tokenized = [[token for token, _, _ in tokenize(text)] for text in texts]
+    yield 'tag/tokenize', len(texts), lambda: [tokenize(text) for text in texts]
+    for tagger_name, tagger_class in sorted(TAGGERS.items()):
+        tagger = tagger_class()
+        yield 'tag/{}'.format(tagger_name), len(texts), lambda tagger=tagger: tagger.tag_tokens_batch(tokenized)
+
+    rng = random.Random(args.seed)
+    names = sorted(ATTACK_MAP['text']) + sorted(ATTACK_MAP['word'])
+    num_rows = len(texts) * args.metrics_factor
+    original_preds = [rng.randint(0, 1) for _ in range(num_rows)]
+    generated_preds = [rng.randint(0, 1) for _ in range(num_rows)]
+    attacks_applied = [rng.sample(names, rng.randint(0, 2)) for _ in range(num_rows)]
+    adversary = Adversary()
+    yield 'metrics/single', num_rows, \
+        lambda: adversary._get_misclassifications_single(original_preds, generated_preds, attacks_applied)
+    yield 'metrics/group', num_rows, \
+        lambda: adversary._get_misclassifications_group(original_preds, generated_preds, attacks_applied)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                       universal_newlines=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """
+    Prints the throughput of every benchmark relative to a baseline results file.
+    """
+    baseline_by_name = dict((r['name'], r) for r in baseline['results'])
+    print('{:<40} {:>14} {:>14} {:>8}'.format('benchmark', 'baseline/s', 'current/s', 'ratio'))
+    for r in results['results']:
+        b = baseline_by_name.get(r['name'])
+        if b is None or not b['items_per_s'] or not r['items_per_s']:
+            continue
+        ratio = r['items_per_s'] / b['items_per_s']
+        print('{:<40} {:>14.1f} {:>14.1f} {:>7.2f}x'.format(r['name'], b['items_per_s'], r['items_per_s'], ratio))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--texts', type=int, default=1000, help='Number of synthetic texts')
+    parser.add_argument('--words', type=int, default=20, help='Number of words per synthetic text')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--tagger', choices=sorted(TAGGERS), default='lexicon', help='Tagger used by generate')
+    parser.add_argument('--sampling', choices=['python', 'numpy'], default='python')
+    parser.add_argument('--shard-size', type=int, default=1000)
+    parser.add_argument('--metrics-factor', type=int, default=100, help='Metric rows per synthetic text')
+    parser.add_argument('--only', default='', help='Only run benchmarks whose name contains this')
+    parser.add_argument('--output', help='Write results as JSON to this path')
+    parser.add_argument('--compare', help='Results JSON of an earlier run to compare throughput with')
+    args = parser.parse_args()
+
+    texts = make_corpus(args.texts, args.words, args.seed)
+    results = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'args': vars(args),
+        'results': [],
+    }
+    for name, num_items, function in benchmarks(texts, args):
+        if args.only in name:
+            result = measure(name, function, num_items, args.repeat)
+            results['results'].append(result)
+            items_per_s = '{:.1f}'.format(result['items_per_s']) if result['items_per_s'] is not None else 'n/a'
+            print('{:<40} {:>14} items/s {:>10} KiB peak'.format(name, items_per_s, result['peak_kb']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
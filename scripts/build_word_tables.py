@@ -0,0 +1,18 @@
+"""
+Rebuilds the memory-mapped word tables in Adversary/data/ from their editable sources, synonyms.json and
+neutral_words.txt. Run it after editing either source and commit the rebuilt .bin files with it.
+
+Usage: python scripts/build_word_tables.py
+"""
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from Adversary.constants import DATA_DIR, build_word_tables  # noqa: E402
+
+
+if __name__ == '__main__':
+    build_word_tables()
+    print('Wrote synonyms.bin and neutral_words.bin to {}'.format(DATA_DIR))
@@ -4,14 +4,21 @@ setup(
     name='Adversary',
     version='1.1.1',
     packages=['tests', 'Adversary'],
+    package_data={'Adversary': ['data/*.bin', 'data/*.json', 'data/*.txt']},
     url='https://github.com/airbnb/artificial-adversary',
     license='MIT',
     author='Devin Soni',
     author_email='devinsoni1010@gmail.com',
     description='Creates adversarial text examples for machine learning models',
+    python_requires='>=3.7',
     install_requires=[
+        'numpy',
         'pandas',
         'nltk',
         'textblob'
     ],
+    extras_require={
+        'arrow': ['pyarrow'],
+        'cli': ['pyyaml'],
+    },
 )
@@ -1,4 +1,7 @@
 from Adversary.adversary import Adversary
+from Adversary.attacks import ATTACK_MAP, change_case, text_attack, unregister_attack, word_attack
+from Adversary.metrics import MetricsEvaluator
+from Adversary.taggers import LexiconTagger
 
 def test_generate_single_iter():
     m = Adversary(verbose=True)
@@ -34,3 +37,141 @@ def test_attack_large():
     g = m.generate(og_texts)
     df_s, df_m = m.attack(og_texts, g, lambda x: 1 if x in og_texts else 0)
     assert (df_s is not None and df_m is not None)
+
+def test_tag_cache():
+    m = Adversary(tag_cache_size=10)
+    text = 'tell me awful things'
+    m.tag_cache.put(text, (('tell', 0, 4, 'VB'), ('me', 5, 7, 'PRP'), ('awful', 8, 13, 'JJ'), ('things', 14, 20, 'NNS')))
+    g = m.generate([text] * 5, attacks=['change_case'])
+    assert(len(g) == 5)
+    assert(m.tag_cache_info()['hits'] == 5)
+
+def test_generate_lexicon_tagger():
+    m = Adversary(tagger=LexiconTagger())
+    og_texts = ['tell me awful things'] * 1000
+    g = m.generate(og_texts, attacks=['change_case', 'swap_letters'], text_sample_rate=2)
+    assert(len(g) == 2000)
+    assert(m.tag_cache_info()['hits'] > 0)
+
+def test_generate_n_jobs_deterministic():
+    og_texts = ['tell me awful things', u'okay okay yeah here', 'happy dog'] * 20
+    g_single = Adversary(tagger=LexiconTagger()).generate(og_texts, text_sample_rate=2, random_seed=7, shard_size=8)
+    g_multi = Adversary(tagger=LexiconTagger()).generate(og_texts, text_sample_rate=2, random_seed=7, shard_size=8, n_jobs=3)
+    assert(len(g_single) == 120)
+    assert(g_single == g_multi)
+    assert(sorted(t_g[2] for t_g in g_multi) == sorted(list(range(60)) * 2))
+
+def test_iter_generate_stream():
+    m = Adversary(tagger=LexiconTagger())
+    og_texts = ['tell me awful things', u'okay okay yeah here', 'happy dog'] * 5
+    g = m.generate(og_texts, text_sample_rate=2, random_seed=3, shard_size=4)
+    stream = m.iter_generate((t for t in og_texts), text_sample_rate=2, random_seed=3, shard_size=4)
+    assert(sorted(stream, key=lambda row: row[2]) == sorted(g, key=lambda row: row[2]))
+    g = m.generate(og_texts, random_seed=3, shard_size=4)
+    assert(list(m.iter_generate((t for t in og_texts), random_seed=3, shard_size=4)) == g)
+    chunks = list(m.iter_generate(iter(og_texts), random_seed=3, shard_size=4, chunked=True))
+    assert([len(chunk) for chunk in chunks] == [4, 4, 4, 3])
+
+def test_attack_batch_predict_function():
+    m = Adversary(tagger=LexiconTagger())
+    og_texts = ['tell me awful things', u'okay okay yeah here', 'happy dog']
+    g = m.generate(og_texts, text_sample_rate=10, random_seed=1)
+    calls = []
+    def batch_predict(texts):
+        calls.append(list(texts))
+        return [1 if x in og_texts else 0 for x in texts]
+    df_s, df_m = m.attack(og_texts, g, batch_predict_function=batch_predict, batch_size=8)
+    expected_s, expected_m = m.attack(og_texts, g, lambda x: 1 if x in og_texts else 0)
+    predicted = [x for c in calls for x in c]
+    assert(predicted[:3] == og_texts and len(set(predicted)) == len(predicted))
+    assert(max(len(c) for c in calls) == 8)
+    assert(m.prediction_stats['saved'] == 60 - m.prediction_stats['predicted'])
+    assert(df_s.equals(expected_s) and df_m.equals(expected_m))
+
+def test_read_config_plan():
+    m = Adversary()
+    plan = m._read_config({'change_case': 0.5, 'swap_words': 0.2, 'good_word_attack': 0.1})
+    assert([step.name for step in plan] == ['swap_words', 'good_word_attack', 'change_case'])
+    assert([step.kind for step in plan] == ['text', 'text', 'word'])
+    assert(plan[2].function is change_case and plan[2].probability == 0.5)
+    assert(len(m._read_config('all')) == len(ATTACK_MAP['text']) + len(ATTACK_MAP['word']))
+
+def test_generate_numpy_sampling():
+    og_texts = ['tell me awful things', u'okay okay yeah here', 'happy dog'] * 20
+    m = Adversary(tagger=LexiconTagger())
+    g = m.generate(og_texts, text_sample_rate=0.5, random_seed=5, sampling='numpy', shard_size=16)
+    assert(len(g) == 60)
+    assert(g == m.generate(og_texts, text_sample_rate=0.5, random_seed=5, sampling='numpy', shard_size=16, n_jobs=2))
+    assert(any(t_g[1] for t_g in g) and any(not t_g[1] for t_g in g))
+
+def test_generate_instance_seed():
+    og_texts = ['tell me awful things', u'okay okay yeah here', 'happy dog'] * 5
+    g_1 = Adversary(tagger=LexiconTagger(), random_seed=11).generate(og_texts, text_sample_rate=3)
+    g_2 = Adversary(tagger=LexiconTagger(), random_seed=11).generate(og_texts, text_sample_rate=3)
+    assert(g_1 == g_2)
+
+def test_generate_custom_attacks():
+    @word_attack(name='shout', batch=lambda words, rng: [w.upper() + '!' for w in words])
+    def shout(word, rng=None):
+        return word.upper()
+    @text_attack(name='pad', precedence=3)
+    def pad(text, rng=None):
+        return text + ' :)'
+    try:
+        m = Adversary(tagger=LexiconTagger())
+        g = m.generate(['tell me awful things'], attacks={'pad': 1., 'shout': 1.}, word_sample_rate=1.)
+        assert(g == [('TELL! me AWFUL! THINGS! :)', ['shout', 'pad'], 0)])
+        g = m.generate(['tell me awful things'] * 4, attacks={'pad': 1., 'shout': 1.}, word_sample_rate=1., n_jobs=2,
+                       shard_size=2)
+        assert(g == [('TELL! me AWFUL! THINGS! :)', ['shout', 'pad'], i) for i in range(4)])
+    finally:
+        unregister_attack('shout')
+        unregister_attack('pad')
+
+def test_generate_keeps_whitespace_and_punctuation():
+    text = 'Wire me  10 dollars,\tthen   call!'
+    m = Adversary(tagger=LexiconTagger())
+    g = m.generate([text] * 20, attacks={'change_case': 1.0}, word_sample_rate=1.0, random_seed=3)
+    for attacked, _, _ in g:
+        assert(attacked.lower() == text.lower())
+
+def test_attack_stream_in_chunks_and_resume(tmpdir):
+    og_texts = ['tell me awful things', 'please wire me 10 dollars', 'happy dog']
+    m = Adversary(tagger=LexiconTagger())
+    g = m.generate(og_texts, text_sample_rate=10, random_seed=4)
+    predict = lambda x: 1 if x in og_texts else 0
+    df_s, df_m = m.attack(og_texts, g, predict)
+    df_s_chunked, df_m_chunked = m.attack(og_texts, iter(g), predict, chunk_size=7)
+    assert(df_s.equals(df_s_chunked) and df_m.equals(df_m_chunked))
+
+    checkpoint = str(tmpdir.join('checkpoint.json'))
+    m.attack(og_texts, g[:14], predict, chunk_size=7, checkpoint=checkpoint)
+    evaluator = MetricsEvaluator.load(checkpoint)
+    assert(evaluator.num_texts == 14)
+    df_s_resumed, df_m_resumed = m.attack(og_texts, iter(g), predict, chunk_size=7, evaluator=evaluator)
+    assert(df_s.equals(df_s_resumed) and df_m.equals(df_m_resumed))
+    assert(m.evaluator is evaluator and evaluator.num_texts == len(g))
+
+def test_attack_drops_original_labels_of_passed_shards():
+    og_texts = ['tell me awful things', 'please wire me 10 dollars', 'happy dog', 'sad cat', 'send money']
+    m = Adversary(tagger=LexiconTagger())
+    g = list(m.iter_generate(og_texts, text_sample_rate=3, attacks={'good_word_attack': 1.}, random_seed=5,
+                             shard_size=2, metadata=True))
+    predicted = []
+    predict = lambda x: predicted.append(x) or (1 if x in og_texts else 0)
+    df_s, df_m = m.attack(og_texts, g, predict)
+    df_s_chunked, df_m_chunked = m.attack(og_texts, iter(g), predict, chunk_size=4)
+    assert(df_s.equals(df_s_chunked) and df_m.equals(df_m_chunked))
+    # with shard_size 2 every shard spans two chunks, and its originals are only predicted once
+    del predicted[:]
+    m.attack(og_texts, iter(g), predict, chunk_size=4)
+    assert(sorted(x for x in predicted if x in og_texts) == sorted(og_texts))
+
+def test_generate_orders_by_iteration_across_shards():
+    og_texts = ['tell me awful things', 'please wire me 10 dollars', 'happy dog', 'sad cat', 'send money']
+    m = Adversary(tagger=LexiconTagger())
+    g = m.generate(og_texts, text_sample_rate=2, random_seed=6, shard_size=2)
+    assert([row[2] for row in g] == list(range(5)) * 2)
+    rows = list(m.iter_generate(og_texts, text_sample_rate=2, random_seed=6, shard_size=2, metadata=True))
+    assert([row[2] for row in rows] == [0, 1, 0, 1, 2, 3, 2, 3, 4, 4])
+    assert(sorted(g) == sorted(row[:3] for row in rows))
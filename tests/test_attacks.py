@@ -1,5 +1,107 @@
+import pickle
+import random
+
 from Adversary.attacks import *
 
 def test_num_to_word():
     assert(num_to_word('1') == 'one')
     assert(num_to_word('dog') == 'dog')
+
+def test_attacks_use_rng():
+    for attacks in ATTACK_MAP.values():
+        for name, attack in attacks.items():
+            text = 'please wire me 10 dollars today'
+            assert(attack(text, random.Random(1)) == attack(text, random.Random(1)))
+
+def test_attacks_leave_global_random_alone():
+    random.seed(0)
+    expected = random.random()
+    random.seed(0)
+    swap_letters('scamland', random.Random(1))
+    good_word_attack('tell me awful things', random.Random(1))
+    assert(random.random() == expected)
+
+def test_register_attack():
+    @text_attack(name='zero_width_space', precedence=1, batch=lambda texts, rng: [t.replace(' ', u' \u200b') for t in texts])
+    def zero_width_space(text, rng=None):
+        return text.replace(' ', u' \u200b')
+    try:
+        assert(ATTACK_MAP['text']['zero_width_space'] is zero_width_space)
+        assert(ATTACK_PRECEDENCE['zero_width_space'] == 1 and 'zero_width_space' in BATCH_ATTACK_MAP)
+    finally:
+        unregister_attack('zero_width_space')
+    assert('zero_width_space' not in ATTACK_MAP['text'] and 'zero_width_space' not in ATTACK_PRECEDENCE)
+
+def test_batch_attack_requires_registered_attack():
+    try:
+        batch_attack('not_an_attack')(lambda words, rng: words)
+        assert(False)
+    except ValueError:
+        pass
+
+def test_batch_attacks_match_single_attacks():
+    words = ['scamland', 'wire', 'me', 'DOLLARS', 'a', '10', 'limited', 'bank']
+    for name, batch in BATCH_ATTACK_MAP.items():
+        rng = random.Random(2)
+        expected = [ATTACK_MAP['word'][name](word, rng) for word in words]
+        assert(batch(words, random.Random(2)) == expected)
+
+def test_letter_to_symbol_tables():
+    tables = build_homoglyph_tables(num_tables=4, homoglyphs={'a': '@4', 'o': '0'})
+    assert(len(tables) == 4 and all(table[ord('o')] == '0' for table in tables))
+    try:
+        set_homoglyph_tables(num_tables=1, homoglyphs={'o': '0'})
+        assert(letter_to_symbol('foo', random.Random(0)) == 'f00')
+    finally:
+        set_homoglyph_tables()
+
+def test_load_confusables(tmpdir):
+    path = tmpdir.join('confusables.txt')
+    path.write_text(u'# confusables sample\n'
+                    u'0430 ;\t0061 ;\tMA\t# ( а → a ) CYRILLIC SMALL LETTER A → LATIN SMALL LETTER A\n'
+                    u'237A ;\t0061 ;\tMA\t# ( ⍺ → a ) APL FUNCTIONAL SYMBOL ALPHA → LATIN SMALL LETTER A\n'
+                    u'0131 0307 ;\t0069 ;\tMA\t# multi-character source\n'
+                    u'2024 ;\t002E ;\tMA\t# ( ․ → . ) ONE DOT LEADER → FULL STOP\n', encoding='utf-8')
+    confusables = load_confusables(str(path))
+    assert(confusables == {'a': u'aа⍺'})
+    assert(merge_homoglyphs({'a': 'Aa@'}, confusables)['a'] == u'Aa@а⍺')
+
+def test_synonym_index_keeps_inflection_case_and_punctuation():
+    index = SynonymIndex(synonyms={'car': ['car', 'automobiles', 'automobile'], 'walk': ['walk', 'stroll', 'walking'],
+                                   'tell': ['tell', 'telling', 'inform'], 'I': ['i', 'ive'], 'we': ['we', 'they']},
+                         known_words=['strolled', 'informs'])
+    assert(index.candidates('Cars,') == ['Cars,', 'Automobiles,'])
+    assert(index.candidates('WALKED') == ['WALKED', 'STROLLED'])
+    assert(index.candidates('tells') == ['tells', 'informs'])
+    assert(index.candidates('is') is None)
+    assert(index.candidates('wed') is None)
+    assert(index.candidates('bus') is None)
+    try:
+        set_synonym_index(index)
+        assert(synonym('(car)', random.Random(0)) in ['(car)', '(automobiles)', '(automobile)'])
+        assert(synonym('bus', random.Random(0)) == 'bus')
+    finally:
+        set_synonym_index()
+
+def test_synonym_index_resolves_shared_forms_and_unknown_inflections():
+    index = SynonymIndex(synonyms={'car': ['car', 'automobile'], 'care': ['care', 'concern', 'worry'],
+                                   'cop': ['cops', 'policeman'], 'thing': ['thing', 'really']},
+                         known_words=['concerned', 'worried', 'caring', 'concerning', 'worrying'])
+    # 'cared' and 'caring' are forms of both 'car' and 'care', the e-final stem wins
+    assert(index.candidates('cared') == ['cared', 'concerned', 'worried'])
+    assert(index.candidates('caring') == ['caring', 'concerning', 'worrying'])
+    # nouns are not inflected into non-words such as 'policemaned' and 'reallies'
+    assert(index.candidates('coped') == ['coped'])
+    assert(index.candidates('things') == ['things'])
+    assert(index.candidates('cops') == ['cops'])
+    assert(SynonymIndex(synonyms={'car': ['car'], 'cars': ['cars', 'autos']}).candidates('cars') == ['cars', 'autos'])
+    assert(SynonymIndex(synonyms={'aid': ['help'], 'aide': ['assistant']}).candidates('aided') is None)
+
+def test_synonym_index_save_and_load(tmpdir):
+    index = SynonymIndex(synonyms={'car': ['car', 'automobile'], 'walk': ['walk', 'stroll']}, known_words=['strolling'])
+    path = str(tmpdir.join('synonyms.bin'))
+    index.save(path)
+    loaded = SynonymIndex.load(path)
+    for word in ['car', 'Cars', 'walking.', 'walked', 'bus']:
+        assert(loaded.candidates(word) == index.candidates(word))
+    assert(pickle.loads(pickle.dumps(loaded)).path == path)
@@ -0,0 +1,78 @@
+import io
+import json
+import os
+
+from Adversary.cli import load_function, main, read_config, read_texts
+
+texts = ['please wire me {} dollars to the bank, today'.format(i) for i in range(30)]
+
+def write_inputs(tmpdir, num_texts):
+    with io.open(str(tmpdir.join('texts.jsonl')), 'w', encoding='utf-8') as f:
+        for text in texts[:num_texts]:
+            f.write(json.dumps({'text': text}) + u'\n')
+    tmpdir.join('model.py').write('def predict(text):\n    return 1 if "dollars" in text else 0\n')
+    tmpdir.join('attacks.yaml').write('attacks:\n  change_case: 0.5\n  swap_words: 0.5\ntext_sample_rate: 2\n')
+
+def run(tmpdir, output, *flags):
+    return main([str(tmpdir.join('texts.jsonl')), str(tmpdir.join(output)), '--config', str(tmpdir.join('attacks.yaml')),
+                 '--model', str(tmpdir.join('model.py')) + ':predict', '--tagger', 'lexicon', '--chunk-size', '10',
+                 '--seed', '3'] + list(flags))
+
+def read_output(tmpdir, output):
+    parts = sorted(name for name in os.listdir(str(tmpdir.join(output))) if name.startswith('part-'))
+    return [tmpdir.join(output, name).read() for name in parts], tmpdir.join(output, 'misclassifications_group.csv').read()
+
+def test_read_texts(tmpdir):
+    path = tmpdir.join('texts.csv')
+    path.write('id,text\n1,"hello, world"\n2,bye\n')
+    assert(list(read_texts(str(path))) == ['hello, world', 'bye'])
+    path = tmpdir.join('texts.jsonl')
+    path.write('"plain"\n{"body": "field"}\n')
+    assert(list(read_texts(str(path), column='body')) == ['plain', 'field'])
+
+def test_read_config_and_load_function(tmpdir):
+    write_inputs(tmpdir, 1)
+    assert(read_config(str(tmpdir.join('attacks.yaml'))) == ({'change_case': 0.5, 'swap_words': 0.5}, {'text_sample_rate': 2}))
+    assert(load_function(str(tmpdir.join('model.py')) + ':predict')('10 dollars') == 1)
+
+def test_main_writes_parts_and_metrics(tmpdir):
+    write_inputs(tmpdir, 25)
+    assert(run(tmpdir, 'out') == 0)
+    parts, metrics = read_output(tmpdir, 'out')
+    assert(len(parts) == 3)
+    rows = [json.loads(line) for part in parts for line in part.splitlines()]
+    assert(len(rows) == 50 and sorted(set(row['original_index'] for row in rows)) == list(range(25)))
+    assert('Caused Misclassifications' in metrics)
+
+def test_main_resume(tmpdir):
+    write_inputs(tmpdir, 30)
+    run(tmpdir, 'full')
+    write_inputs(tmpdir, 20)
+    run(tmpdir, 'resumed')
+    write_inputs(tmpdir, 30)
+    run(tmpdir, 'resumed', '--resume')
+    assert(read_output(tmpdir, 'resumed') == read_output(tmpdir, 'full'))
+
+def test_main_reports_attack_progress(tmpdir, capsys):
+    write_inputs(tmpdir, 25)
+    run(tmpdir, 'out', '--verbose')
+    finished = [line for line in capsys.readouterr().out.splitlines() if line.startswith('attack: 50 texts')]
+    assert(len(finished) == 1 and 'model calls' in finished[0] and 'accuracy on generated texts' in finished[0])
+
+def test_main_resume_rejects_different_settings(tmpdir):
+    write_inputs(tmpdir, 20)
+    run(tmpdir, 'out')
+    for flags in [['--word-sample-rate', '0.5'], ['--tagger', 'textblob'], ['--seed', '4'], ['--sampling', 'numpy']]:
+        try:
+            run(tmpdir, 'out', '--resume', *flags)
+            assert(False)
+        except ValueError as e:
+            assert('different settings' in str(e))
+    tmpdir.join('attacks.yaml').write('attacks:\n  change_case: 1.0\ntext_sample_rate: 2\n')
+    try:
+        run(tmpdir, 'out', '--resume')
+        assert(False)
+    except ValueError as e:
+        assert("attacks {'change_case': 0.5, 'swap_words': 0.5} (now {'change_case': 1.0})" in str(e))
+    write_inputs(tmpdir, 20)
+    assert(run(tmpdir, 'out', '--resume') == 0)
@@ -0,0 +1,8 @@
+import os
+import subprocess
+import sys
+
+def test_import_has_no_heavy_dependencies():
+    script = 'import sys, Adversary, Adversary.attacks; print(sorted(set(sys.modules) & {"numpy", "pandas", "textblob", "nltk"}))'
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert(subprocess.check_output([sys.executable, '-c', script], cwd=repo_dir, universal_newlines=True).strip() == '[]')
@@ -0,0 +1,50 @@
+from Adversary.metrics import *
+
+original_preds = [1, 1, 1, 0, 1, 1]
+generated_preds = [0, 1, 0, 0, 0, 1]
+attacks_applied = [['synonym'], ['synonym', 'swap_words'], ['swap_words', 'synonym'], ['change_case'], [], ['synonym']]
+
+def test_group_outcome_counts():
+    groups, counts = group_outcome_counts(original_preds, generated_preds, attacks_applied)
+    assert(groups == [('synonym',), ('swap_words', 'synonym'), ('change_case',), ()])
+    assert(counts.tolist() == [[1, 1, 0], [1, 1, 0], [0, 0, 1], [1, 0, 0]])
+
+def test_misclassifications_single():
+    df = misclassifications_single(*group_outcome_counts(original_preds, generated_preds, attacks_applied))
+    assert(list(df.index) == ['Change Case', 'Swap Words', 'Synonym'])
+    assert(df.loc['Synonym'].tolist() == [2, 2, 0])
+    assert(df.loc['Change Case'].tolist() == [0, 0, 1])
+
+def test_misclassifications_group():
+    df = misclassifications_group(*group_outcome_counts(original_preds, generated_preds, attacks_applied))
+    assert(df.shape == (3, 6))
+    assert(list(df.columns) == ['Change Case', 'Swap Words', 'Synonym'] + OUTCOME_COLUMNS)
+    pair = df[(df['Swap Words'] == 'X') & (df['Synonym'] == 'X')]
+    assert(pair[OUTCOME_COLUMNS].values.tolist() == [[1, 1, 0]])
+    assert(df[OUTCOME_COLUMNS[0]].tolist() == sorted(df[OUTCOME_COLUMNS[0]].tolist(), reverse=True))
+
+def test_misclassifications_group_all_combinations():
+    groups, counts = group_outcome_counts(original_preds, generated_preds, attacks_applied)
+    df = misclassifications_group(groups, counts, all_combinations=True)
+    assert(df.shape == (6, 6))
+    change_case_and_synonym = df[(df['Change Case'] == 'X') & (df['Synonym'] == 'X')]
+    assert(change_case_and_synonym[OUTCOME_COLUMNS].values.tolist() == [[0, 0, 0]])
+
+def test_metrics_evaluator_matches_single_pass():
+    generated = [('text', applied, 0) for applied in attacks_applied]
+    evaluator = MetricsEvaluator()
+    for start in range(0, len(generated), 4):
+        evaluator.update(generated[start:start + 4], original_preds[start:start + 4], generated_preds[start:start + 4])
+    groups, counts = group_outcome_counts(original_preds, generated_preds, attacks_applied)
+    assert(evaluator.misclassifications_single().equals(misclassifications_single(groups, counts)))
+    assert(evaluator.misclassifications_group().equals(misclassifications_group(groups, counts)))
+    assert(evaluator.num_texts == 6 and evaluator.num_generated_positive == 2)
+
+def test_metrics_evaluator_checkpoint(tmpdir):
+    evaluator = MetricsEvaluator()
+    evaluator.update([('text', applied, 0) for applied in attacks_applied], original_preds, generated_preds)
+    path = str(tmpdir.join('checkpoint.json'))
+    evaluator.save(path)
+    loaded = MetricsEvaluator.load(path)
+    assert(loaded.state() == evaluator.state())
+    assert(loaded.misclassifications_group().equals(evaluator.misclassifications_group()))
@@ -0,0 +1,45 @@
+import pytest
+
+from Adversary import Adversary
+from Adversary.output import GeneratedTextWriter
+from Adversary.taggers import LexiconTagger
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+og_texts = ['tell me awful things', 'please wire me 10 dollars', 'happy dog']
+
+def test_iter_generate_metadata():
+    m = Adversary(tagger=LexiconTagger())
+    rows = list(m.iter_generate(og_texts, text_sample_rate=2, random_seed=5, shard_size=2, metadata=True))
+    plain = list(m.iter_generate(og_texts, text_sample_rate=2, random_seed=5, shard_size=2))
+    assert([row[:3] for row in rows] == plain)
+    assert([row[3] for row in rows] == [0, 0, 1, 1, 0, 1])
+    assert(len(set(row[4] for row in rows)) == 2)
+
+def test_generated_text_writer_row_groups(tmpdir):
+    path = str(tmpdir.join('generated.parquet'))
+    rows = [('text {}'.format(i), ['swap_words'] if i % 2 else [], i, 0, 2 ** 63 + i) for i in range(10)]
+    with GeneratedTextWriter(path, row_group_size=4) as writer:
+        writer.write(rows[:3])
+        writer.write(rows[3:])
+    assert(pq.ParquetFile(path).num_row_groups == 3)
+    table = pq.read_table(path)
+    assert(table.column_names == ['attacked_text', 'attacks', 'original_index', 'iteration', 'seed'])
+    assert([tuple(row.values()) for row in table.to_pylist()] == rows)
+
+def test_generate_saves_columnar_output(tmpdir):
+    output = str(tmpdir) + '/'
+    m = Adversary(tagger=LexiconTagger(), output=output, output_format='arrow')
+    g = m.generate(og_texts, random_seed=5, save=True)
+    with pa.ipc.open_file(output + 'generated_text.arrow') as reader:
+        table = reader.read_all()
+    assert(table.column('attacked_text').to_pylist() == [text for text, _, _ in g])
+    assert(table.column('attacks').to_pylist() == [attacks for _, attacks, _ in g])
+
+def test_unknown_output_format():
+    try:
+        Adversary(output_format='csv')
+        assert(False)
+    except ValueError:
+        pass
@@ -0,0 +1,45 @@
+import asyncio
+
+from Adversary.prediction import *
+
+def test_predict_texts_single():
+    assert(predict_texts(['a', 'bb', 'a'], predict_function=len) == [1, 2, 1])
+
+def test_predict_texts_batches():
+    batches = []
+    def batch_predict(texts):
+        batches.append(len(texts))
+        return [len(t) for t in texts]
+    assert(predict_texts(['a', 'bb', 'ccc', 'a', 'bb'], batch_predict_function=batch_predict, batch_size=2) == [1, 2, 3, 1, 2])
+    assert(batches == [2, 2, 1])
+
+def test_predict_distinct():
+    predicted = []
+    def predict(texts):
+        predicted.extend(texts)
+        return [len(t) for t in texts]
+    preds, num_predicted = predict_distinct(['a', 'bb', 'a', 'a', 'bb'], predict)
+    assert(preds == [1, 2, 1, 1, 2])
+    assert(num_predicted == 2 and predicted == ['a', 'bb'])
+
+def test_predict_texts_concurrent_keeps_order():
+    texts = [str(i) for i in range(100)]
+    assert(predict_texts(texts, predict_function=int, max_concurrency=8) == list(range(100)))
+
+def test_predict_texts_async():
+    async def predict(text):
+        await asyncio.sleep(0)
+        return len(text)
+    assert(predict_texts(['a', 'bb', 'ccc'], predict_function=predict, max_concurrency=2) == [1, 2, 3])
+
+def test_predict_texts_retries():
+    failures = []
+    def flaky_predict(texts):
+        if not failures:
+            failures.append(texts)
+            raise IOError('model server unavailable')
+        return [len(t) for t in texts]
+    retried = []
+    preds = predict_texts(['a', 'bb'], batch_predict_function=flaky_predict, retries=1,
+                          on_retry=lambda e, attempt, arg: retried.append((attempt, arg)))
+    assert(preds == [1, 2] and retried == [(1, ['a', 'bb'])])
@@ -0,0 +1,34 @@
+from Adversary import Adversary
+from Adversary.profiling import Profiler
+from Adversary.taggers import LexiconTagger
+
+og_texts = ['tell me awful things', 'please wire me 10 dollars', 'happy dog'] * 10
+
+def test_profiling_disabled_by_default():
+    m = Adversary(tagger=LexiconTagger())
+    m.generate(og_texts)
+    assert(m.profiler is None and m.profile_results() is None)
+
+def test_profile_generate_and_attack():
+    shard_profiles = []
+    m = Adversary(tagger=LexiconTagger(), profile=Profiler(callbacks=[shard_profiles.append]))
+    g = m.generate(og_texts, attacks={'num_to_word': 1.0, 'swap_words': 1.0}, word_sample_rate=1.0, shard_size=10)
+    results = m.profile_results()
+    assert(len(shard_profiles) == 3)
+    assert(set(['sampling', 'tagging', 'word_sampling', 'word_attacks', 'text_attacks', 'splicing', 'output'])
+           <= set(results['stages']))
+    assert(results['stages']['sampling']['items'] == 30)
+    # swap_words only changes texts of more than three words, num_to_word only changes digits
+    assert(results['attacks']['swap_words']['calls'] == 30 and results['attacks']['swap_words']['noops'] == 10)
+    assert(results['attacks']['num_to_word']['noop_rate'] > 0.5)
+
+    m.attack(og_texts, g, lambda x: 1)
+    assert(results['stages'] != m.profile_results()['stages'])
+    assert(m.profile_results()['stages']['predict']['items'] == 60)
+    stages, attacks = m.profiler.to_dataframes()
+    assert(attacks.loc['swap_words', 'calls'] == 30 and 'predict' in stages.index)
+
+def test_profile_merges_worker_processes():
+    m = Adversary(tagger=LexiconTagger(), profile=True)
+    m.generate(og_texts, attacks={'swap_words': 1.0}, shard_size=10, n_jobs=2)
+    assert(m.profile_results()['attacks']['swap_words']['calls'] == 30)
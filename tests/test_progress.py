@@ -0,0 +1,48 @@
+import logging
+import pickle
+
+from Adversary import Adversary
+from Adversary.progress import LoggingSink, ProgressReporter, format_progress
+from Adversary.taggers import LexiconTagger
+
+og_texts = ['tell me awful things', 'please wire me 10 dollars', 'happy dog'] * 10
+
+def test_progress_events_for_generate_and_attack():
+    events = []
+    m = Adversary(tagger=LexiconTagger(), progress=ProgressReporter(sinks=[events.append], interval=0))
+    g = m.generate(og_texts, text_sample_rate=2, shard_size=10, n_jobs=2)
+    assert([(e['task'], e['done'], e['total'], e['final']) for e in events] ==
+           [('generate', 20, 60, False), ('generate', 40, 60, False), ('generate', 60, 60, False), ('generate', 60, 60, True)])
+    assert(events[0]['eta'] is not None and events[0]['rate'] > 0)
+
+    del events[:]
+    m.attack(og_texts, g, lambda x: 1, chunk_size=25)
+    assert([e['done'] for e in events] == [25, 50, 60, 60])
+    assert(events[-1]['info']['accuracy_on_original_texts'] == 1.0)
+
+def test_adversary_pickles_without_progress_sinks():
+    m = Adversary(tagger=LexiconTagger(), progress=ProgressReporter(sinks=[lambda event: None]))
+    g = m.generate(og_texts, random_seed=1)
+    m.attack(og_texts, g, lambda x: 1)
+    copy = pickle.loads(pickle.dumps(m))
+    assert(copy.progress.sinks == [] and copy.evaluator is None)
+    assert(len(copy.tag_cache) == 0 and copy.tag_cache.maxsize == m.tag_cache.maxsize and len(m.tag_cache) > 0)
+    assert(copy.generate(og_texts, random_seed=1) == g)
+
+def test_progress_throttled_by_time():
+    events = []
+    m = Adversary(tagger=LexiconTagger(), progress=ProgressReporter(sinks=[events.append], interval=3600))
+    m.generate(iter(og_texts), shard_size=5)
+    assert(len(events) == 1 and events[0]['final'] and events[0]['total'] is None)
+
+def test_logging_sink(caplog):
+    caplog.set_level(logging.INFO, logger='Adversary')
+    m = Adversary(tagger=LexiconTagger(), progress=ProgressReporter(sinks=[LoggingSink()]))
+    m.generate(og_texts)
+    assert(caplog.records[-1].progress['task'] == 'generate')
+    assert(caplog.records[-1].getMessage().startswith('generate: 30/30 texts (100.0%)'))
+
+def test_format_progress():
+    event = {'task': 'attack', 'unit': 'texts', 'done': 50, 'total': 200, 'elapsed': 5., 'rate': 10., 'eta': 15.,
+             'final': False, 'info': {}}
+    assert(format_progress(event) == 'attack: 50/200 texts (25.0%), 10.0 texts/s, ETA 0:00:15')
@@ -0,0 +1,36 @@
+import os
+
+import Adversary
+import Adversary.attacks
+import Adversary.constants as constants
+from Adversary.resources import *
+
+def test_string_table_round_trip(tmpdir):
+    path = str(tmpdir.join('table.bin'))
+    write_string_table(path, [['dog', 'cat', 'hound'], ['cat', 'dog'], [u'café']])
+    table = StringTable(path)
+    assert(len(table) == 3)
+    assert(table.list(0) == ['dog', 'cat', 'hound'] and table.list(2) == [u'café'])
+    assert(dict(StringListMap(table)) == {'dog': ['cat', 'hound'], 'cat': ['dog'], u'café': []})
+
+def test_constants_word_lists():
+    assert(constants.SYNONYMS is constants.load_synonyms())
+    assert(constants.SYNONYMS['limited'] == ['limited', 'unrestricted', 'restricted'])
+    assert(len(constants.SYNONYMS) == 2999)
+    assert(constants.NEUTRAL_WORDS[:3] == ['come', 'get', 'give'] and len(constants.NEUTRAL_WORDS) == 699)
+
+def test_word_lists_resolve_through_star_imports():
+    assert(Adversary.SYNONYMS is constants.load_synonyms() and Adversary.attacks.SYNONYMS is constants.load_synonyms())
+    assert(Adversary.NEUTRAL_WORDS is constants.load_neutral_words())
+    assert(Adversary.attacks.NEUTRAL_WORDS is constants.load_neutral_words())
+    try:
+        Adversary.attacks.NO_SUCH_CONSTANT
+        assert(False)
+    except AttributeError:
+        pass
+
+def test_word_tables_match_their_sources(tmpdir):
+    constants.build_word_tables(output_dir=str(tmpdir))
+    for name in ['synonyms.bin', 'neutral_words.bin']:
+        with open(os.path.join(constants.DATA_DIR, name), 'rb') as f:
+            assert(tmpdir.join(name).read_binary() == f.read())
@@ -0,0 +1,8 @@
+from Adversary.sampling import *
+
+def test_samplers_reproducible():
+    for sampler_class in SAMPLERS.values():
+        draws = sampler_class(3).bernoulli_matrix(50, [0., 0.5, 1.])
+        assert(draws == sampler_class(3).bernoulli_matrix(50, [0., 0.5, 1.]))
+        assert(all(not row[0] and row[2] for row in draws))
+        assert(len(sampler_class(3).bernoulli(7, 0.5)) == 7)
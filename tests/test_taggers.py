@@ -0,0 +1,28 @@
+from Adversary.taggers import *
+
+def test_tokenize_offsets():
+    text = "Wire me  10,000 dollars (don't wait)!"
+    tokens = tokenize(text)
+    assert([token for token, _, _ in tokens] == ['Wire', 'me', '10,000', 'dollars', '(', "don't", 'wait', ')', '!'])
+    assert(all(text[start:end] == token for token, start, end in tokens))
+
+def test_tag_tokens_aligns_with_tokens():
+    class SplittingTagger(Tagger):
+        def tag(self, text):
+            return [(word.strip(','), 'NN') for word in text.split() if word != '(']
+    assert(SplittingTagger().tag_tokens(['wire', '(', 'money', ',', 'now']) == ['NN', None, 'NN', None, 'NN'])
+
+def test_textblob_tagger_tags_every_token():
+    tokens = [token for token, _, _ in tokenize("wire me 10 dollars, don't wait!")]
+    assert(len(TextBlobTagger().tag_tokens(tokens)) == len(tokens))
+
+def test_lexicon_tagger_tag():
+    tagger = LexiconTagger()
+    tags = tagger.tag('tell me 10 awful things, quickly !')
+    assert([word for word, tag in tags] == ['tell', 'me', '10', 'awful', 'things', ',', 'quickly', '!'])
+    assert([tag for word, tag in tags] == ['NN', 'PRP', 'CD', 'NN', 'NNS', 'SYM', 'RB', 'SYM'])
+
+def test_lexicon_tagger_tag_batch():
+    tagger = LexiconTagger()
+    texts = ['tell me awful things', 'the dog', 'tell me awful things']
+    assert(tagger.tag_batch(texts) == [tagger.tag(text) for text in texts])
@@ -11,3 +11,18 @@ def test_combinations_of_len():
 def test_fancy_titles():
     cols = ['change_case', 'insert_duplicate_characters', 'synonym']
     assert(fancy_titles(cols) == ['Change Case', 'Insert Duplicate Characters', 'Synonym'])
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert(cache.get('a') == 1)
+    cache.put('c', 3)
+    assert('b' not in cache and 'a' in cache and 'c' in cache)
+    assert(cache.get('b') is None)
+    assert(cache.info() == {'hits': 1, 'misses': 1, 'size': 2, 'maxsize': 2})
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+    cache.put('a', 1)
+    assert(cache.get('a') is None and len(cache) == 0)